@@ -60,7 +60,7 @@ from typing import Dict, List, Optional, Union
 from ops import BoundEvent, EventBase
 from ops.charm import CharmBase
 from ops.framework import Object
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError, field_validator
 
 # The unique Charmhub library identifier, never change it
 LIBID = "3fcd828c77024b0f9a7ea3544805456b"
@@ -70,16 +70,18 @@ LIBAPI = 0
 
 # Increment this PATCH version before using `charmcraft publish-lib` or reset
 # to 0 if you are raising the major API version
-LIBPATCH = 2
+LIBPATCH = 3
 
 # Regex to check if the provided TTL is a correct duration
 DURATION_REGEX = r"^(?=.*\d)(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?$"
+DURATION_RE = re.compile(DURATION_REGEX)
 
 # Regex to validate cron expressions (5 or 6 fields)
 # Supports: minute hour day-of-month month day-of-week [year]
 # Each field can be: number, *, */n, n-m, n,m,o, or combinations
 CRON_FIELD = r"(\*|(\*/\d+)|(\d+(-\d+)?)(,\d+(-\d+)?)*|\?)"
 CRON_REGEX = rf"^{CRON_FIELD}(\s+{CRON_FIELD}){{4,5}}$"
+CRON_RE = re.compile(CRON_REGEX)
 
 SPEC_FIELD = "spec"
 APP_FIELD = "app"
@@ -127,17 +129,40 @@ class VeleroBackupSpec(BaseModel):
     skip_immediately: Optional[bool] = None
     use_owner_references_in_backup: Optional[bool] = None
 
-    def __post_init__(self):
-        """Validate the specification."""
-        if self.ttl and not re.match(DURATION_REGEX, self.ttl):
+    @field_validator("ttl")
+    @classmethod
+    def validate_ttl(cls, value: Optional[str]) -> Optional[str]:
+        """Validate the TTL duration format."""
+        if value and not DURATION_RE.match(value):
             raise ValueError(
-                f"Invalid TTL format: {self.ttl}. Expected format: '24h', '10h10m10s', etc."
+                f"Invalid TTL format: {value}. Expected format: '24h', '10h10m10s', etc."
             )
-        if self.schedule and not re.match(CRON_REGEX, self.schedule):
+        return value
+
+    @field_validator("schedule")
+    @classmethod
+    def validate_schedule(cls, value: Optional[str]) -> Optional[str]:
+        """Validate the cron expression format."""
+        if value and not CRON_RE.match(value):
             raise ValueError(
-                f"Invalid cron expression: {self.schedule}. "
+                f"Invalid cron expression: {value}. "
                 "Expected format: '* * * * *' (min hour day month weekday)"
             )
+        return value
+
+
+def _load_spec(json_data: str, app_name: Optional[str]) -> Optional[VeleroBackupSpec]:
+    """Parse a spec published by a provider, skipping it if it is invalid.
+
+    Providers validate their specs, but older ones may publish values this library
+    rejects, such as a TTL in days. Those specs are logged and ignored rather than
+    failing the whole hook.
+    """
+    try:
+        return VeleroBackupSpec.model_validate_json(json_data)
+    except ValidationError as e:
+        logger.warning("Ignoring invalid backup spec from app '%s': %s", app_name, e)
+        return None
 
 
 class VeleroBackupRequier(Object):
@@ -167,17 +192,16 @@ class VeleroBackupRequier(Object):
         Returns:
             Optional[VeleroBackupSpec]: The backup specification if available, otherwise None.
         """
-        relations = self.model.relations[self._relation_name]
-
-        for relation in relations:
+        # Read the relation data on every call, so callers that keep this object across
+        # events (e.g. under Harness) always see the current specs
+        for relation in self.model.relations[self._relation_name]:
             data = relation.data.get(relation.app, {})
             if (
                 data.get(APP_FIELD) == app_name
                 and data.get(MODEL_FIELD) == model
                 and data.get(RELATION_FIELD) == endpoint
             ):
-                json_data = data.get(SPEC_FIELD, "{}")
-                return VeleroBackupSpec.model_validate_json(json_data)
+                return _load_spec(data.get(SPEC_FIELD, "{}"), app_name)
 
         logger.warning("No backup spec found for app '%s' and endpoint '%s'", app_name, endpoint)
         return None
@@ -186,15 +210,16 @@ class VeleroBackupRequier(Object):
         """Get a list of all active VeleroBackupSpec objects across all relations.
 
         Returns:
-            List[VeleroBackupSpec]: A list of all active backup specifications.
+            List[VeleroBackupSpec]: A list of all active backup specifications. Relations
+                that have not published a spec yet, or published an invalid one, are skipped.
         """
         specs = []
-        relations = self.model.relations[self._relation_name]
-
-        for relation in relations:
-            json_data = relation.data[relation.app].get(SPEC_FIELD, "{}")
-            specs.append(VeleroBackupSpec.model_validate_json(json_data))
-
+        for relation in self.model.relations[self._relation_name]:
+            if not relation.app or not relation.data[relation.app].get(SPEC_FIELD):
+                continue
+            spec = _load_spec(relation.data[relation.app][SPEC_FIELD], relation.app.name)
+            if spec is not None:
+                specs.append(spec)
         return specs
 
 
@@ -224,17 +249,19 @@ class VeleroBackupProvider(Object):
         self._relation_name = relation_name
         self._spec = spec
 
-        self.framework.observe(self._charm.on.leader_elected, self._send_data)
-        self.framework.observe(
-            self._charm.on[self._relation_name].relation_created, self._send_data
-        )
-        self.framework.observe(self._charm.on.upgrade_charm, self._send_data)
-
+        events = [
+            self._charm.on.leader_elected,
+            self._charm.on[self._relation_name].relation_created,
+            self._charm.on.upgrade_charm,
+        ]
         if refresh_event:
             if not isinstance(refresh_event, (tuple, list)):
-                refresh_event = [refresh_event]
-            for event in refresh_event:
-                self.framework.observe(event, self._send_data)
+                refresh_event = (refresh_event,)
+            events.extend(refresh_event)
+
+        observe = self.framework.observe
+        for event in events:
+            observe(event, self._send_data)
 
     def _send_data(self, event: EventBase):
         """Handle any event where we should send data to the relation."""
@@ -254,12 +281,18 @@ class VeleroBackupProvider(Object):
                 self._relation_name,
             )
             return
+
+        # Serialize once per event, after any changes the charm made to the spec
+        databag = {
+            MODEL_FIELD: self._model,
+            APP_FIELD: self._app_name,
+            RELATION_FIELD: self._relation_name,
+            SPEC_FIELD: self._spec.model_dump_json(),
+        }
         for relation in relations:
-            relation.data[self._charm.app].update(
-                {
-                    MODEL_FIELD: self._model,
-                    APP_FIELD: self._app_name,
-                    RELATION_FIELD: self._relation_name,
-                    SPEC_FIELD: self._spec.model_dump_json(),
-                }
-            )
+            current = relation.data[self._charm.app]
+            # Skip the relation-set call (and the remote relation-changed it
+            # would trigger) when the databag already holds this payload
+            if all(current.get(key) == value for key, value in databag.items()):
+                continue
+            current.update(databag)
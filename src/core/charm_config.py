@@ -13,6 +13,7 @@ from pydantic import field_validator, model_validator
 # Regex to validate cron expressions (5 or 6 fields)
 CRON_FIELD = r"(\*|(\*/\d+)|(\d+(-\d+)?)(,\d+(-\d+)?)*|\?)"
 CRON_REGEX = rf"^{CRON_FIELD}(\s+{CRON_FIELD}){{4,5}}$"
+CRON_RE = re.compile(CRON_REGEX)
 
 
 class CharmConfigInvalidError(Exception):
@@ -32,6 +33,20 @@ class CharmConfig(BaseConfigModel):
     skip_immediately: bool = False
     use_owner_references_in_backup: bool = False
 
+    @classmethod
+    def default(cls) -> "CharmConfig":
+        """Return the default configuration without running validation.
+
+        ``model_construct`` skips validators, which is only safe because every value
+        here is a literal default.
+        """
+        return cls.model_construct(
+            schedule=None,
+            paused=False,
+            skip_immediately=False,
+            use_owner_references_in_backup=False,
+        )
+
     @field_validator("schedule", mode="before")
     @classmethod
     def blank_string(cls, value):
@@ -43,7 +58,7 @@ class CharmConfig(BaseConfigModel):
     @model_validator(mode="after")
     def validate_schedule(self):
         """Validate the cron expression if provided."""
-        if self.schedule and not re.match(CRON_REGEX, self.schedule):
+        if self.schedule and not CRON_RE.match(self.schedule):
             raise ValueError(
                 f"Invalid cron expression: {self.schedule}. "
                 "Expected format: '* * * * *' (min hour day month weekday)"
@@ -4,10 +4,13 @@
 
 """Charm Context definition and parsing logic."""
 
+from functools import cached_property
 from typing import TYPE_CHECKING, Optional, cast
 
 import ops
-from charmlibs.interfaces.k8s_backup_target._schema import ProviderAppData  # noqa: PLC2701
+from charmlibs.interfaces.k8s_backup_target._schema import (  # noqa: PLC2701
+    BACKUP_TARGETS_FIELD,
+)
 from ops import Object, Relation
 from pydantic import ValidationError
 
@@ -16,13 +19,20 @@ from constants import (
     VELERO_BACKUP_RELATION,
 )
 from core.charm_config import CharmConfig
-from core.domain import BackupTargetInfo
+from core.domain import BackupTargetInfo, parse_backup_targets
 from utils.logging import WithLogging
 
 if TYPE_CHECKING:
     from charm import VeleroIntegratorCharm
 
 
+def _config_option_name(loc: tuple[int | str, ...]) -> str:
+    """Map a pydantic error location to the Juju config option name."""
+    if len(loc) == 1:
+        return str(loc[0]).replace("_", "-")
+    return ".".join(str(p).replace("_", "-") for p in loc)
+
+
 class Context(Object, WithLogging):
     """Properties and relations of the charm - single source of truth for state."""
 
@@ -30,43 +40,52 @@ class Context(Object, WithLogging):
         super().__init__(charm, "charm_context")
         self.charm = charm
 
+    @cached_property
+    def raw_config(self) -> ops.ConfigData:
+        """Return the raw Juju configuration, fetched once per dispatch."""
+        return self.charm.config
+
+    @cached_property
+    def _validated_config(self) -> tuple[Optional[CharmConfig], list[str]]:
+        """Validate the charm configuration once per dispatch.
+
+        Returns:
+            Tuple of the validated CharmConfig (or None if invalid) and the list of
+            invalid configuration fields.
+        """
+        raw = self.raw_config
+        options = {
+            "schedule": cast(Optional[str], raw.get("schedule")),
+            "paused": cast(bool, raw.get("paused", False)),
+            "skip_immediately": cast(bool, raw.get("skip-immediately", False)),
+            "use_owner_references_in_backup": cast(
+                bool, raw.get("use-owner-references-in-backup", False)
+            ),
+        }
+        # Unset or empty options all map to the defaults, which need no validation
+        if not any(options.values()):
+            return CharmConfig.default(), []
+        try:
+            return CharmConfig(**options), []
+        except ValidationError as ve:
+            return None, [_config_option_name(err["loc"]) for err in ve.errors()]
+
     @property
     def config(self) -> Optional[CharmConfig]:
         """Return validated charm configuration or None if invalid."""
-        try:
-            return CharmConfig(
-                schedule=cast(Optional[str], self.charm.config.get("schedule")),
-                paused=bool(self.charm.config.get("paused")),
-                skip_immediately=bool(self.charm.config.get("skip-immediately")),
-                use_owner_references_in_backup=bool(
-                    self.charm.config.get("use-owner-references-in-backup")
-                ),
-            )
-        except ValidationError:
-            return None
+        return self._validated_config[0]
 
     @property
     def config_errors(self) -> list[str]:
         """Return list of configuration validation error fields."""
-        try:
-            CharmConfig(
-                schedule=cast(Optional[str], self.charm.config.get("schedule")),
-                paused=bool(self.charm.config.get("paused")),
-                skip_immediately=bool(self.charm.config.get("skip-immediately")),
-                use_owner_references_in_backup=bool(
-                    self.charm.config.get("use-owner-references-in-backup")
-                ),
-            )
-            return []
-        except ValidationError as ve:
-            return [".".join(str(p).replace("_", "-") for p in err["loc"]) for err in ve.errors()]
+        return self._validated_config[1]
 
-    @property
+    @cached_property
     def velero_relations(self) -> list[Relation]:
         """Return all velero-backup relations."""
         return self.charm.model.relations.get(VELERO_BACKUP_RELATION, [])
 
-    @property
+    @cached_property
     def k8s_backup_relations(self) -> list[Relation]:
         """Return all k8s-backup-target relations."""
         return self.charm.model.relations.get(K8S_BACKUP_TARGET_RELATION, [])
@@ -74,12 +93,17 @@ class Context(Object, WithLogging):
     @property
     def has_velero_relation(self) -> bool:
         """Check if velero-backup relation exists."""
-        return len(self.velero_relations) > 0
+        return bool(self.velero_relations)
 
     @property
     def has_k8s_backup_relation(self) -> bool:
         """Check if any k8s-backup-target relation exists."""
-        return len(self.k8s_backup_relations) > 0
+        return bool(self.k8s_backup_relations)
+
+    @cached_property
+    def backup_targets(self) -> list[BackupTargetInfo]:
+        """Return the backup targets, loaded once per dispatch."""
+        return self.get_backup_targets()
 
     def get_backup_targets(self) -> list[BackupTargetInfo]:
         """Get all backup target information from k8s-backup-target relations.
@@ -92,7 +116,16 @@ class Context(Object, WithLogging):
             if not relation.app:
                 continue
             try:
-                provider_data = relation.load(ProviderAppData, relation.app)
+                raw_targets = relation.data[relation.app].get(BACKUP_TARGETS_FIELD)
+                if not raw_targets:
+                    self.logger.debug(
+                        "No %s published on relation %s (app=%s)",
+                        BACKUP_TARGETS_FIELD,
+                        relation.name,
+                        relation.app,
+                    )
+                    continue
+                entries = parse_backup_targets(raw_targets)
             except (ops.RelationDataError, ValueError) as e:
                 self.logger.warning(
                     "Failed to load provider data from relation %s (app=%s): %s",
@@ -101,14 +134,14 @@ class Context(Object, WithLogging):
                     e,
                 )
                 continue
-            for entry in provider_data.backup_targets:
-                targets.append(
-                    BackupTargetInfo(
-                        spec=entry.spec,
-                        app_name=entry.app,
-                        relation_name=entry.relation_name,
-                        model_name=entry.model,
-                        relation=relation,
-                    )
+            targets.extend(
+                BackupTargetInfo(
+                    spec=entry.spec,
+                    app_name=entry.app,
+                    relation_name=entry.relation_name,
+                    model_name=entry.model,
+                    relation=relation,
                 )
+                for entry in entries
+            )
         return targets
@@ -7,8 +7,10 @@
 from dataclasses import dataclass
 
 from charmlibs.interfaces.k8s_backup_target import K8sBackupTargetSpec
+from charmlibs.interfaces.k8s_backup_target._schema import BackupTargetEntry  # noqa: PLC2701
 from charms.velero_libs.v0.velero_backup_config import VeleroBackupSpec
 from ops import Relation
+from pydantic import TypeAdapter
 
 from core.charm_config import CharmConfig
 
@@ -18,8 +20,27 @@ APP_FIELD = "app"
 RELATION_FIELD = "relation_name"
 MODEL_FIELD = "model"
 
+# Validates the provider's backup_targets field straight from its JSON string,
+# without decoding the rest of the databag first.
+BACKUP_TARGETS_ADAPTER = TypeAdapter(list[BackupTargetEntry])
 
-@dataclass
+
+def parse_backup_targets(raw_targets: str) -> list[BackupTargetEntry]:
+    """Parse the backup_targets JSON published by a k8s-backup-target provider.
+
+    Args:
+        raw_targets: The JSON-encoded list of backup target entries.
+
+    Returns:
+        List of validated backup target entries.
+
+    Raises:
+        ValidationError: If the JSON is malformed or does not match the schema.
+    """
+    return BACKUP_TARGETS_ADAPTER.validate_json(raw_targets)
+
+
+@dataclass(frozen=True, slots=True)
 class BackupTargetInfo:
     """Information about a backup target from k8s-backup-target relation."""
 
@@ -37,17 +58,21 @@ class BackupTargetInfo:
 
         Returns:
             A new VeleroBackupSpec with merged values including schedule configuration.
-        """
-        spec_dict = self.spec.model_dump()
 
-        # Add schedule-related fields from charm config
-        if config.schedule:
-            spec_dict["schedule"] = config.schedule
-        spec_dict["paused"] = config.paused
-        spec_dict["skip_immediately"] = config.skip_immediately
-        spec_dict["use_owner_references_in_backup"] = config.use_owner_references_in_backup
-
-        return VeleroBackupSpec.model_validate(spec_dict)
+        Raises:
+            ValidationError: If the merged spec is not a valid VeleroBackupSpec.
+        """
+        # The upstream spec does not check every field (e.g. ttl), so validate the
+        # merged result against the schema velero-operator will parse it with
+        return VeleroBackupSpec.model_validate(
+            dict(
+                self.spec,
+                schedule=config.schedule,
+                paused=config.paused,
+                skip_immediately=config.skip_immediately,
+                use_owner_references_in_backup=config.use_owner_references_in_backup,
+            )
+        )
 
     def to_databag_dict(self, velero_spec: VeleroBackupSpec) -> dict:
         """Create databag dictionary for velero-backup relation.
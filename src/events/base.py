@@ -4,9 +4,10 @@
 
 """Base utilities exposing common functionalities for all Events classes."""
 
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
 
-from ops import Object
+from ops import BoundEvent, Object
 
 from utils.logging import WithLogging
 
@@ -18,3 +19,9 @@ class BaseEventHandler(Object, WithLogging):
     """Base class for all Event Handler classes in the Velero Integrator."""
 
     charm: "VeleroIntegratorCharm"
+
+    def _observe_many(self, observers: Iterable[tuple[BoundEvent, Callable[[Any], None]]]) -> None:
+        """Register several (event, handler) pairs with the framework."""
+        observe = self.framework.observe
+        for event, handler in observers:
+            observe(event, handler)
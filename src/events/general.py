@@ -26,9 +26,13 @@ class GeneralEvents(BaseEventHandler):
         self.charm = charm
         self.context = context
 
-        self.framework.observe(self.charm.on.config_changed, self._on_config_changed)
-        self.framework.observe(self.charm.on.upgrade_charm, self._on_upgrade_charm)
-        self.framework.observe(self.charm.on.update_status, self._on_update_status)
+        self._observe_many(
+            (
+                (self.charm.on.config_changed, self._on_config_changed),
+                (self.charm.on.upgrade_charm, self._on_upgrade_charm),
+                (self.charm.on.update_status, self._on_update_status),
+            )
+        )
 
     def _on_config_changed(self, _: ConfigChangedEvent) -> None:
         """Handle config changed event."""
@@ -50,7 +54,7 @@ class GeneralEvents(BaseEventHandler):
             self.charm.unit.status = ops.ActiveStatus("Unit is ready (standby)")
             return
 
-        self.logger.debug(f"Reconciling. Current configuration: {self.charm.config}")
+        self.logger.debug("Reconciling. Current configuration: %s", self.context.raw_config)
 
         # Check for config errors
         config_errors = self.context.config_errors
@@ -67,7 +71,7 @@ class GeneralEvents(BaseEventHandler):
             return
 
         # Publish to velero-backup relations
-        self.charm.velero_backup_events.publish_to_all_relations()
+        skipped = self.charm.velero_backup_events.publish_to_all_relations()
 
         # Check for missing k8s-backup-target relation
         if not self.context.has_k8s_backup_relation:
@@ -76,6 +80,13 @@ class GeneralEvents(BaseEventHandler):
             )
             return
 
+        # Targets whose spec velero-operator would reject are not published
+        if skipped:
+            self.charm.unit.status = ops.BlockedStatus(
+                f"Invalid backup spec from: {', '.join(skipped)}"
+            )
+            return
+
         # Compute final status based on schedule config
         config = self.context.config
         if config and config.is_scheduled:
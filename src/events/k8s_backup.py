@@ -6,12 +6,7 @@
 
 from typing import TYPE_CHECKING
 
-from ops.charm import (
-    RelationBrokenEvent,
-    RelationChangedEvent,
-    RelationCreatedEvent,
-    RelationJoinedEvent,
-)
+from ops.charm import RelationEvent
 
 from constants import K8S_BACKUP_TARGET_RELATION
 from core.context import Context
@@ -30,41 +25,20 @@ class K8sBackupTargetEvents(BaseEventHandler):
         self.charm = charm
         self.context = context
 
-        self.framework.observe(
-            self.charm.on[K8S_BACKUP_TARGET_RELATION].relation_created,
-            self._on_relation_created,
+        relation_events = self.charm.on[K8S_BACKUP_TARGET_RELATION]
+        self._observe_many(
+            (event, self._on_relation_event)
+            for event in (
+                relation_events.relation_created,
+                relation_events.relation_joined,
+                relation_events.relation_changed,
+                relation_events.relation_broken,
+            )
         )
-        self.framework.observe(
-            self.charm.on[K8S_BACKUP_TARGET_RELATION].relation_joined,
-            self._on_relation_joined,
-        )
-        self.framework.observe(
-            self.charm.on[K8S_BACKUP_TARGET_RELATION].relation_changed,
-            self._on_relation_changed,
-        )
-        self.framework.observe(
-            self.charm.on[K8S_BACKUP_TARGET_RELATION].relation_broken,
-            self._on_relation_broken,
-        )
-
-    def _on_relation_created(self, _: RelationCreatedEvent) -> None:
-        """Handle k8s-backup-target relation created."""
-        self.logger.info("%s relation created", K8S_BACKUP_TARGET_RELATION)
-        self._trigger_reconcile()
-
-    def _on_relation_joined(self, _: RelationJoinedEvent) -> None:
-        """Handle k8s-backup-target relation joined."""
-        self.logger.info("%s relation joined", K8S_BACKUP_TARGET_RELATION)
-        self._trigger_reconcile()
-
-    def _on_relation_changed(self, _: RelationChangedEvent) -> None:
-        """Handle k8s-backup-target relation changed."""
-        self.logger.info("%s relation changed", K8S_BACKUP_TARGET_RELATION)
-        self._trigger_reconcile()
 
-    def _on_relation_broken(self, _: RelationBrokenEvent) -> None:
-        """Handle k8s-backup-target relation broken."""
-        self.logger.info("%s relation broken", K8S_BACKUP_TARGET_RELATION)
+    def _on_relation_event(self, event: RelationEvent) -> None:
+        """Handle any k8s-backup-target relation lifecycle event."""
+        self.logger.info("%s relation event: %s", K8S_BACKUP_TARGET_RELATION, type(event).__name__)
         self._trigger_reconcile()
 
     def _trigger_reconcile(self) -> None:
@@ -7,15 +7,13 @@
 from typing import TYPE_CHECKING
 
 from ops import Relation
-from ops.charm import (
-    RelationBrokenEvent,
-    RelationChangedEvent,
-    RelationCreatedEvent,
-    RelationJoinedEvent,
-)
+from ops.charm import RelationEvent
+from pydantic import ValidationError
 
 from constants import VELERO_BACKUP_RELATION
+from core.charm_config import CharmConfig
 from core.context import Context
+from core.domain import BackupTargetInfo
 from events.base import BaseEventHandler
 
 if TYPE_CHECKING:
@@ -31,41 +29,20 @@ class VeleroBackupEvents(BaseEventHandler):
         self.charm = charm
         self.context = context
 
-        self.framework.observe(
-            self.charm.on[VELERO_BACKUP_RELATION].relation_created,
-            self._on_relation_created,
-        )
-        self.framework.observe(
-            self.charm.on[VELERO_BACKUP_RELATION].relation_joined,
-            self._on_relation_joined,
-        )
-        self.framework.observe(
-            self.charm.on[VELERO_BACKUP_RELATION].relation_changed,
-            self._on_relation_changed,
-        )
-        self.framework.observe(
-            self.charm.on[VELERO_BACKUP_RELATION].relation_broken,
-            self._on_relation_broken,
+        relation_events = self.charm.on[VELERO_BACKUP_RELATION]
+        self._observe_many(
+            (event, self._on_relation_event)
+            for event in (
+                relation_events.relation_created,
+                relation_events.relation_joined,
+                relation_events.relation_changed,
+                relation_events.relation_broken,
+            )
         )
 
-    def _on_relation_created(self, _: RelationCreatedEvent) -> None:
-        """Handle velero-backup relation created."""
-        self.logger.info("%s relation created", VELERO_BACKUP_RELATION)
-        self._trigger_reconcile()
-
-    def _on_relation_joined(self, _: RelationJoinedEvent) -> None:
-        """Handle velero-backup relation joined."""
-        self.logger.info("%s relation joined", VELERO_BACKUP_RELATION)
-        self._trigger_reconcile()
-
-    def _on_relation_changed(self, _: RelationChangedEvent) -> None:
-        """Handle velero-backup relation changed."""
-        self.logger.info("%s relation changed", VELERO_BACKUP_RELATION)
-        self._trigger_reconcile()
-
-    def _on_relation_broken(self, _: RelationBrokenEvent) -> None:
-        """Handle velero-backup relation broken."""
-        self.logger.info("%s relation broken", VELERO_BACKUP_RELATION)
+    def _on_relation_event(self, event: RelationEvent) -> None:
+        """Handle any velero-backup relation lifecycle event."""
+        self.logger.info("%s relation event: %s", VELERO_BACKUP_RELATION, type(event).__name__)
         self._trigger_reconcile()
 
     def _trigger_reconcile(self) -> None:
@@ -82,23 +59,69 @@ class VeleroBackupEvents(BaseEventHandler):
             self.logger.warning("Invalid config, skipping publish")
             return
 
-        # Get all backup targets and publish merged specs
-        targets = self.context.get_backup_targets()
-        for target in targets:
-            velero_spec = target.to_velero_spec(config)
-            databag = target.to_databag_dict(velero_spec)
-            relation.data[self.charm.app].update(databag)
-            self.logger.info(
-                "Published backup spec from %s to %s relation %s",
-                target.app_name,
-                VELERO_BACKUP_RELATION,
-                relation.id,
-            )
+        databag, _ = self._build_databag(config, self.context.backup_targets)
+        self._write_databag(relation, databag)
+
+    def publish_to_all_relations(self) -> list[str]:
+        """Publish backup specs to all velero-backup relations.
 
-    def publish_to_all_relations(self) -> None:
-        """Publish backup specs to all velero-backup relations."""
+        Returns:
+            Names of the target apps whose spec was invalid and therefore not published.
+        """
         if not self.charm.unit.is_leader():
-            return
+            return []
+
+        config = self.context.config
+        if not config:
+            self.logger.warning("Invalid config, skipping publish")
+            return []
 
+        # The databag does not depend on the relation, so build it once for all of them
+        databag, skipped = self._build_databag(config, self.context.backup_targets)
         for relation in self.context.velero_relations:
-            self.publish_to_relation(relation)
+            self._write_databag(relation, databag)
+        return skipped
+
+    def _build_databag(
+        self, config: CharmConfig, targets: list[BackupTargetInfo]
+    ) -> tuple[dict[str, str], list[str]]:
+        """Merge the specs of all backup targets into a velero-backup databag.
+
+        Targets share the same databag keys, so later targets override earlier ones.
+        Targets whose spec is not a valid VeleroBackupSpec are skipped.
+
+        Returns:
+            Tuple of the merged databag and the names of the skipped target apps.
+        """
+        databag: dict[str, str] = {}
+        merged: list[str] = []
+        skipped: list[str] = []
+        for target in targets:
+            try:
+                databag.update(target.to_databag_dict(target.to_velero_spec(config)))
+            except ValidationError as e:
+                self.logger.warning("Skipping invalid backup spec from %s: %s", target.app_name, e)
+                skipped.append(target.app_name)
+                continue
+            merged.append(target.app_name)
+        if merged:
+            self.logger.debug("Merged backup specs from %s", ", ".join(merged))
+        return databag, skipped
+
+    def _write_databag(self, relation: Relation, databag: dict[str, str]) -> None:
+        """Write a prebuilt databag to a velero-backup relation in a single relation-set."""
+        if not databag:
+            return
+
+        current = relation.data[self.charm.app]
+        delta = {key: value for key, value in databag.items() if current.get(key) != value}
+        if not delta:
+            self.logger.debug(
+                "Backup spec on %s relation %s is up to date", VELERO_BACKUP_RELATION, relation.id
+            )
+            return
+
+        current.update(delta)
+        self.logger.info(
+            "Published backup spec to %s relation %s", VELERO_BACKUP_RELATION, relation.id
+        )
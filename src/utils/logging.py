@@ -5,17 +5,24 @@
 """Utilities for logging."""
 
 from logging import Logger, getLogger
+from typing import ClassVar
 
 
 class WithLogging:
     """Base class to be used for providing a logger embedded in the class."""
 
+    _logger: ClassVar[Logger] = getLogger(f"{__name__}.WithLogging")
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Create the logger once per subclass, shared by all of its instances."""
+        super().__init_subclass__(**kwargs)
+        cls._logger = getLogger(f"{cls.__module__}.{cls.__qualname__}")
+
     @property
     def logger(self) -> Logger:
-        """Create logger.
+        """Return the logger of this class.
 
         Returns:
             Logger: default logger for this class.
         """
-        name_logger = str(self.__class__).replace("<class '", "").replace("'>", "")
-        return getLogger(name_logger)
+        return type(self)._logger
@@ -4,12 +4,15 @@
 """Fixtures for integration tests using Jubilant framework."""
 
 import dataclasses
+import hashlib
 import json
 import logging
 import os
+import shutil
 import socket
 import subprocess
 import sys
+import tempfile
 import time
 import uuid
 from pathlib import Path
@@ -107,9 +110,9 @@ def setup_microceph() -> S3ConnectionInfo:
     return S3ConnectionInfo(access_key, secret_key, OBJECT_STORAGE_BUCKET)
 
 
-@pytest.fixture(scope="module")
-def juju(request: pytest.FixtureRequest):
-    """Create a temporary Juju model for running tests."""
+@pytest.fixture(scope="session")
+def juju_model(request: pytest.FixtureRequest):
+    """Create a temporary Juju model shared by the whole test session."""
     with jubilant.temp_model() as juju:
         yield juju
 
@@ -120,51 +123,176 @@ def juju(request: pytest.FixtureRequest):
             print(log, end="", file=sys.stderr)
 
 
-@pytest.fixture(scope="session")
-def velero_integrator_charm() -> Path:
-    """Build and return the path to the velero-integrator charm."""
-    charm_path = Path(".")
-
-    if "CHARM_PATH" in os.environ:
-        charm_path = Path(os.environ["CHARM_PATH"])
-        if not charm_path.exists():
-            raise FileNotFoundError(f"Charm does not exist: {charm_path}")
-        return charm_path
+def has_later_module(request: pytest.FixtureRequest) -> bool:
+    """Whether the session still has tests from another module after this one."""
+    items = request.session.items
+    module_items = [i for i, item in enumerate(items) if item.module is request.module]
+    return bool(module_items) and any(
+        item.module is not request.module for item in items[module_items[-1] + 1 :]
+    )
 
-    # Build the charm
-    logger.info("Building velero-integrator charm")
-    subprocess.check_call(["charmcraft", "pack", "-v"], cwd=charm_path)
 
-    charm_files = list(charm_path.glob("*.charm"))
+@pytest.fixture(scope="module")
+def juju(request: pytest.FixtureRequest, juju_model: jubilant.Juju):
+    """Provide the session model, removing the applications a test module deployed.
+
+    Tests within a module build on each other's deployments, so cleanup happens
+    once the module is done rather than after every test. It is skipped when no
+    other module follows, since the model is destroyed right after anyway.
+    """
+    apps_before = set(juju_model.status().apps)
+    yield juju_model
+
+    if not has_later_module(request):
+        return
+    deployed = set(juju_model.status().apps) - apps_before
+    if deployed:
+        logger.info("Removing applications deployed by the module: %s", sorted(deployed))
+        juju_model.remove_application(*deployed, destroy_storage=True, force=True)
+        juju_model.wait(lambda status: not deployed & set(status.apps), timeout=600)
+
+
+@pytest.fixture
+def restore_config(juju: jubilant.Juju):
+    """Collect application config to restore once the test is done.
+
+    Tests fill the yielded mapping of application -> options. Each application gets one
+    ``juju config`` call at teardown, without waiting: the next test's own settle wait
+    covers the reset, so cleanup does not cost a settle window of its own.
+    """
+    pending: dict[str, dict[str, str]] = {}
+    yield pending
+
+    for app, config in pending.items():
+        juju.config(app, config)
+
+
+# Charms used by the tests: fixture key -> (env var with a prebuilt charm, source directory)
+CHARMS = {
+    "velero-integrator": ("CHARM_PATH", Path(".")),
+    "test-app": ("TEST_APP_CHARM_PATH", Path("tests/integration/test-app")),
+}
+
+
+# Files and directories, relative to the charm directory, that determine the packed charm
+CHARM_SOURCES = {
+    "velero-integrator": ["src", "lib", "charmcraft.yaml", "actions.yaml", "requirements.txt"],
+    "test-app": ["src", "charmcraft.yaml", "requirements.txt"],
+}
+
+# Opt-in cache of packed charms, keyed on a hash of their sources
+CHARM_CACHE_DIR = Path.home() / ".cache" / "velero-integrator-tests"
+
+
+def is_charm_cache_enabled() -> bool:
+    """Whether packed charms may be reused across test sessions."""
+    return os.environ.get("VELERO_CHARM_CACHE") == "1"
+
+
+def charm_build_env() -> dict[str, str]:
+    """Return the environment for `charmcraft pack`."""
+    env = dict(os.environ)
+    if is_charm_cache_enabled():
+        # Let charmcraft reuse downloaded wheels across sessions too
+        env.setdefault("CRAFT_SHARED_CACHE", str(CHARM_CACHE_DIR / "charmcraft"))
+    return env
+
+
+def hash_charm_sources(charm_dir: Path, sources: list[str]) -> str:
+    """Return a digest of the charm sources, stable across sessions."""
+    digest = hashlib.blake2b(digest_size=16)
+    for source in sources:
+        path = charm_dir / source
+        files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+        for file in files:
+            if not file.exists() or "__pycache__" in file.parts:
+                continue
+            digest.update(str(file.relative_to(charm_dir)).encode())
+            digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def find_charm_file(charm_dir: Path) -> Path:
+    """Return the single .charm file in a directory."""
+    with os.scandir(charm_dir) as entries:
+        charm_files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".charm") and entry.is_file()
+        ]
     if not charm_files:
-        raise FileNotFoundError("No .charm file found in current directory")
+        raise FileNotFoundError(f"No .charm file found in {charm_dir}")
     if len(charm_files) > 1:
         path_list = ", ".join(str(p) for p in charm_files)
         raise ValueError(f"More than one .charm file: {path_list}")
-
     return charm_files[0]
 
 
 @pytest.fixture(scope="session")
-def test_app_charm() -> Path:
-    """Build and return the path to the test-app charm."""
-    charm_path = Path("tests/integration/test-app")
+def built_charms() -> dict[str, Path]:
+    """Return the charms under test, building the missing ones in parallel."""
+    charms = {}
+    builds = {}
+    build_logs = {}
+    cache_paths = {}
+    build_env = charm_build_env()
+    for name, (env_var, charm_dir) in CHARMS.items():
+        if env_var in os.environ:
+            charm_path = Path(os.environ[env_var])
+            if not charm_path.exists():
+                raise FileNotFoundError(f"Charm does not exist: {charm_path}")
+            charms[name] = charm_path
+            continue
+
+        if is_charm_cache_enabled():
+            digest = hash_charm_sources(charm_dir, CHARM_SOURCES[name])
+            cache_paths[name] = CHARM_CACHE_DIR / f"{name}-{digest}.charm"
+            if cache_paths[name].exists():
+                logger.info("Using cached %s charm: %s", name, cache_paths[name])
+                charms[name] = cache_paths[name]
+                continue
+
+        logger.info("Building %s charm", name)
+        # Output goes to a file rather than a pipe, so parallel builds cannot block on
+        # a full pipe buffer; it is only surfaced when the build fails
+        build_logs[name] = tempfile.TemporaryFile(mode="w+")
+        builds[name] = subprocess.Popen(
+            ["charmcraft", "pack"],
+            cwd=charm_dir,
+            env=build_env,
+            stdout=build_logs[name],
+            stderr=subprocess.STDOUT,
+        )
 
-    if "TEST_APP_CHARM_PATH" in os.environ:
-        charm_path = Path(os.environ["TEST_APP_CHARM_PATH"])
-        if not charm_path.exists():
-            raise FileNotFoundError(f"Test app charm does not exist: {charm_path}")
-        return charm_path
+    # Wait for every build before failing, so no charmcraft process is left behind
+    for process in builds.values():
+        process.wait()
+    for name, process in builds.items():
+        with build_logs[name] as build_log:
+            if process.returncode != 0:
+                build_log.seek(0)
+                output = build_log.read()
+                logger.error("Building %s charm failed:\n%s", name, output)
+                raise subprocess.CalledProcessError(process.returncode, process.args, output)
+        charms[name] = find_charm_file(CHARMS[name][1])
 
-    # Build the test app charm
-    logger.info("Building test-app charm")
-    subprocess.check_call(["charmcraft", "pack", "-v"], cwd=charm_path)
+        if name in cache_paths:
+            CHARM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(charms[name], cache_paths[name])
 
-    charm_files = list(charm_path.glob("*.charm"))
-    if not charm_files:
-        raise FileNotFoundError(f"No .charm file found in {charm_path}")
+    return charms
 
-    return charm_files[0]
+
+@pytest.fixture(scope="session")
+def velero_integrator_charm(built_charms: dict[str, Path]) -> Path:
+    """Return the path to the velero-integrator charm."""
+    return built_charms["velero-integrator"]
+
+
+@pytest.fixture(scope="session")
+def test_app_charm(built_charms: dict[str, Path]) -> Path:
+    """Return the path to the test-app charm."""
+    return built_charms["test-app"]
 
 
 @pytest.fixture(scope="session")
@@ -5,8 +5,9 @@
 
 import json
 import logging
+import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 import jubilant
 import yaml
@@ -23,7 +24,10 @@ from tenacity import (
 
 logger = logging.getLogger(__name__)
 
-METADATA = yaml.safe_load(Path("charmcraft.yaml").read_text())
+# Use libyaml's C loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+METADATA = yaml.load(Path("charmcraft.yaml").read_text(), Loader=YAML_LOADER)
 APP_NAME = METADATA["name"]
 TEST_APP_NAME = "test-app-velero-integrator"
 VELERO_OPERATOR_APP_NAME = "velero-operator"
@@ -38,35 +42,46 @@ S3_INTEGRATOR = "s3-integrator"
 S3_INTEGRATOR_CHANNEL = "latest/stable"
 
 
-def get_app_status(juju: jubilant.Juju, app_name: str) -> tuple[str, str]:
+def get_app_status(
+    juju: jubilant.Juju, app_name: str, status: jubilant.Status | None = None
+) -> tuple[str, str]:
     """Get the status and message of an application.
 
     Args:
         juju: The Juju instance.
         app_name: Name of the application.
+        status: Status snapshot to read from, for example the one ``juju.wait`` returned.
+            Fetched when not given.
 
     Returns:
         Tuple of (status, message).
     """
-    status = juju.status()
+    status = status if status is not None else juju.status()
     app = status.apps.get(app_name)
     if not app:
         raise ValueError(f"Application {app_name} not found")
     return app.app_status.current, app.app_status.message
 
 
-def get_unit_status(juju: jubilant.Juju, app_name: str, unit_num: int = 0) -> tuple[str, str]:
+def get_unit_status(
+    juju: jubilant.Juju,
+    app_name: str,
+    unit_num: int = 0,
+    status: jubilant.Status | None = None,
+) -> tuple[str, str]:
     """Get the status and message of a unit.
 
     Args:
         juju: The Juju instance.
         app_name: Name of the application.
         unit_num: Unit number (default 0).
+        status: Status snapshot to read from, for example the one ``juju.wait`` returned.
+            Fetched when not given.
 
     Returns:
         Tuple of (status, message).
     """
-    status = juju.status()
+    status = status if status is not None else juju.status()
     app = status.apps.get(app_name)
     if not app:
         raise ValueError(f"Application {app_name} not found")
@@ -94,9 +109,10 @@ def wait_for_status(
         timeout: Timeout in seconds.
     """
 
-    def check():
-        status, message = get_unit_status(juju, app_name)
-        if status != expected_status:
+    def check(status: jubilant.Status) -> bool:
+        # Read the snapshot juju.wait just fetched instead of running `juju status` again
+        current, message = get_unit_status(juju, app_name, status=status)
+        if current != expected_status:
             return False
         if message_contains and message_contains not in message:
             return False
@@ -105,6 +121,55 @@ def wait_for_status(
     juju.wait(check, timeout=timeout)
 
 
+def wait_for(
+    juju: jubilant.Juju,
+    ready: Callable[[jubilant.Status], bool],
+    timeout: float = 120,
+    initial: float = 0.2,
+    factor: float = 1.6,
+    cap: float = 5.0,
+    successes: int = 3,
+    settle: float = 1.0,
+) -> jubilant.Status:
+    """Wait until ``ready`` holds, polling quickly at first and backing off exponentially.
+
+    Unlike ``juju.wait``, which polls once a second, the first change towards ``ready`` is
+    noticed within a fraction of a second while long waits still settle to one poll every
+    ``cap`` seconds. Once ``ready`` holds, polls are at least ``settle`` seconds apart, so
+    the consecutive successes span as long a window as with ``juju.wait``: agents that look
+    idle right after ``juju config`` may not have picked up config-changed yet.
+
+    Args:
+        juju: The Juju instance.
+        ready: Callable that takes a status and returns whether the model is ready.
+        timeout: Timeout in seconds.
+        initial: Delay in seconds before the second poll.
+        factor: Multiplier applied to the delay after each poll.
+        cap: Maximum delay in seconds between polls.
+        successes: Number of consecutive polls ``ready`` must hold for.
+        settle: Minimum delay in seconds between polls while ``ready`` holds.
+
+    Returns:
+        The status that satisfied ``ready``.
+
+    Raises:
+        TimeoutError: If ``ready`` does not hold in time.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial
+    in_a_row = 0
+    while True:
+        status = juju.status()
+        in_a_row = in_a_row + 1 if ready(status) else 0
+        if in_a_row >= successes:
+            return status
+        pause = max(delay, settle) if in_a_row else delay
+        if time.monotonic() + pause > deadline:
+            raise TimeoutError(f"wait timed out after {timeout}s\n{status}")
+        time.sleep(pause)
+        delay = min(delay * factor, cap)
+
+
 def get_relation_data(juju: jubilant.Juju, app_name: str, relation_name: str) -> dict:
     """Get relation data for an application.
 
@@ -117,8 +182,7 @@ def get_relation_data(juju: jubilant.Juju, app_name: str, relation_name: str) ->
         Dictionary of relation data.
     """
     result = juju.cli("show-unit", f"{app_name}/0", "--format", "json")
-    data = json.loads(result)
-    unit_data = data.get(f"{app_name}/0", {})
+    unit_data = json.loads(result).get(f"{app_name}/0", {})
     relation_info = unit_data.get("relation-info", [])
 
     for rel in relation_info:
@@ -145,18 +209,40 @@ def get_application_data_from_relation(
     return rel_data.get("application-data", {})
 
 
-def is_relation_joined(juju: jubilant.Juju, app_name: str, relation_name: str) -> bool:
+def get_backup_spec(juju: jubilant.Juju, app_name: str, relation_name: str) -> dict:
+    """Get the decoded backup spec from a relation's application data.
+
+    Args:
+        juju: The Juju instance.
+        app_name: Name of the application.
+        relation_name: Name of the relation endpoint.
+
+    Returns:
+        The backup spec dictionary.
+    """
+    app_data = get_application_data_from_relation(juju, app_name, relation_name)
+    return json.loads(app_data["spec"])
+
+
+def is_relation_joined(
+    juju: jubilant.Juju,
+    app_name: str,
+    relation_name: str,
+    status: jubilant.Status | None = None,
+) -> bool:
     """Check if a relation is joined.
 
     Args:
         juju: The Juju instance.
         app_name: Name of the application.
         relation_name: Name of the relation endpoint.
+        status: Status snapshot to read from, for example the one ``juju.wait`` passes to
+            its ready callable. Fetched when not given.
 
     Returns:
         True if the relation is joined.
     """
-    status = juju.status()
+    status = status if status is not None else juju.status()
     app = status.apps.get(app_name)
     if not app:
         return False
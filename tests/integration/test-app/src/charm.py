@@ -45,7 +45,8 @@ class TestAppCharm(ops.CharmBase):
 
     def _on_config_changed(self, _: ops.ConfigChangedEvent):
         """Handle the config changed event."""
-        logger.info("Config changed: %s", dict(self.config))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Config changed: %s", dict(self.config))
 
     def _on_relation_joined(self, event: ops.RelationJoinedEvent):
         """Handle the relation joined event."""
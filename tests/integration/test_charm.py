@@ -17,8 +17,10 @@ from helpers import (
     VELERO_OPERATOR_APP_NAME,
     VELERO_OPERATOR_BACKUP_RELATION,
     get_application_data_from_relation,
+    get_backup_spec,
     get_unit_status,
     is_relation_joined,
+    wait_for,
 )
 
 logger = logging.getLogger(__name__)
@@ -29,30 +31,27 @@ def test_build_and_deploy(
     velero_integrator_charm: Path,
     test_app_charm: Path,
 ):
-    """Deploy the velero-integrator and test-app charms."""
-    logger.info("Deploying velero-integrator and test-app charms")
+    """Deploy the velero-integrator, test-app and Velero Operator charms."""
+    logger.info("Deploying velero-integrator, test-app and Velero Operator charms")
 
-    # Deploy velero-integrator
+    # Deployments are independent, so submit them together and let them settle in parallel
     juju.deploy(velero_integrator_charm.resolve(), app=APP_NAME)
-
-    # Deploy test-app
     juju.deploy(test_app_charm.resolve(), app=TEST_APP_NAME)
-
-    # Wait for charms to be idle first
-    juju.wait(jubilant.all_agents_idle, timeout=300)
+    juju.deploy(
+        "velero-operator",
+        app=VELERO_OPERATOR_APP_NAME,
+        channel="edge",
+        revision=442,
+        trust=True,
+    )
 
     # Wait for both to settle (velero-integrator should be blocked)
     juju.wait(
-        lambda status: status.apps[APP_NAME].units[f"{APP_NAME}/0"].workload_status.current
-        == "blocked",
-        timeout=300,
-    )
-    juju.wait(
-        lambda status: status.apps[TEST_APP_NAME]
-        .units[f"{TEST_APP_NAME}/0"]
-        .workload_status.current
+        lambda status: jubilant.all_agents_idle(status, APP_NAME, TEST_APP_NAME)
+        and status.apps[APP_NAME].units[f"{APP_NAME}/0"].workload_status.current == "blocked"
+        and status.apps[TEST_APP_NAME].units[f"{TEST_APP_NAME}/0"].workload_status.current
         == "waiting",
-        timeout=300,
+        timeout=600,
     )
 
 
@@ -65,55 +64,36 @@ def test_integrate_test_app(juju: jubilant.Juju):
         f"{TEST_APP_NAME}:{TEST_APP_RELATION_NAME}",
     )
 
-    # Wait for relation to be established
-    juju.wait(
-        lambda status: is_relation_joined(juju, APP_NAME, INTEGRATOR_K8S_BACKUP_RELATION),
-        timeout=120,
-    )
-
-    # test-app should become active
-    juju.wait(
-        lambda status: status.apps[TEST_APP_NAME]
-        .units[f"{TEST_APP_NAME}/0"]
-        .workload_status.current
+    # Wait for relation to be established and test-app to become active
+    settled = juju.wait(
+        lambda status: is_relation_joined(juju, APP_NAME, INTEGRATOR_K8S_BACKUP_RELATION, status)
+        and status.apps[TEST_APP_NAME].units[f"{TEST_APP_NAME}/0"].workload_status.current
         == "active",
         timeout=120,
     )
 
     # velero-integrator should still be blocked (no velero-backup relation)
-    status, message = get_unit_status(juju, APP_NAME)
+    status, message = get_unit_status(juju, APP_NAME, status=settled)
     assert status == "blocked", f"Expected blocked status, got {status}"
 
 
 def test_integrate_velero_operator(juju: jubilant.Juju):
-    """Deploy and integrate with Velero Operator to verify active status."""
-    logger.info("Deploying Velero Operator")
-    juju.deploy(
-        "velero-operator",
-        app=VELERO_OPERATOR_APP_NAME,
-        channel="edge",
-        revision=442,
-        trust=True,
-    )
-
+    """Integrate with Velero Operator to verify active status."""
     logger.info("Integrating with Velero Operator")
     juju.integrate(
         f"{VELERO_OPERATOR_APP_NAME}:{VELERO_OPERATOR_BACKUP_RELATION}",
         f"{APP_NAME}:{INTEGRATOR_VELERO_BACKUP_RELATION}",
     )
 
-    # Wait for everything to settle
     # Velero Operator might block waiting for S3, but Velero Integrator should become active
     # once related to Velero Operator.
-
-    # Wait for velero-integrator to become active
-    juju.wait(
+    settled = juju.wait(
         lambda status: status.apps[APP_NAME].units[f"{APP_NAME}/0"].workload_status.current
         == "active",
         timeout=600,
     )
 
-    status, _ = get_unit_status(juju, APP_NAME)
+    status, _ = get_unit_status(juju, APP_NAME, status=settled)
     assert status == "active", f"Expected active status for {APP_NAME}, got {status}"
 
 
@@ -144,13 +124,10 @@ def test_config_schedule_propagation(juju: jubilant.Juju):
     juju.config(APP_NAME, {"schedule": "0 2 * * *"})
 
     # Wait for config to be applied
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    wait_for(juju, jubilant.all_agents_idle)
 
     # Verify via relation data on operator side
-    app_data = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec = json.loads(app_data["spec"])
+    spec = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
 
     assert spec.get("schedule") == "0 2 * * *"
     logger.info("Schedule propagation verified")
@@ -165,10 +142,7 @@ def test_update_test_app_propagation(juju: jubilant.Juju):
     juju.wait(jubilant.all_agents_idle, timeout=120)
 
     # Verify via relation data on operator side
-    app_data = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec = json.loads(app_data["spec"])
+    spec = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
 
     assert spec.get("include_namespaces") == ["updated-namespace"]
     assert spec.get("ttl") == "48h"
@@ -183,24 +157,18 @@ def test_config_paused_propagation(juju: jubilant.Juju):
     logger.info("Setting paused configuration")
 
     juju.config(APP_NAME, {"paused": "true"})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    wait_for(juju, jubilant.all_agents_idle)
 
     # Verify paused=true in databag
-    app_data = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec = json.loads(app_data["spec"])
+    spec = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
     assert spec.get("paused") is True
 
     # Resume
     juju.config(APP_NAME, {"paused": "false"})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    wait_for(juju, jubilant.all_agents_idle)
 
     # Verify paused=false in databag
-    app_data = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec = json.loads(app_data["spec"])
+    spec = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
     assert spec.get("paused") is False
 
     logger.info("Pause/Resume propagation verified")
@@ -212,18 +180,18 @@ def test_config_invalid_schedule(juju: jubilant.Juju):
 
     # Set invalid schedule
     juju.config(APP_NAME, {"schedule": "invalid-cron"})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    settled = juju.wait(jubilant.all_agents_idle, timeout=120)
 
     # Should be blocked with config error
-    status, message = get_unit_status(juju, APP_NAME)
+    status, message = get_unit_status(juju, APP_NAME, status=settled)
     assert status == "blocked", f"Expected blocked, got {status}"
 
     # Reset to valid schedule
     juju.config(APP_NAME, {"schedule": "0 2 * * *"})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    settled = juju.wait(jubilant.all_agents_idle, timeout=120)
 
     # Should return to active
-    status, message = get_unit_status(juju, APP_NAME)
+    status, message = get_unit_status(juju, APP_NAME, status=settled)
     assert status == "active", f"Expected active, got {status}"
 
 
@@ -232,10 +200,9 @@ def test_action_status_detail(juju: jubilant.Juju):
     logger.info("Testing status-detail action")
 
     # Run the action and expect success
-    cmd_output = juju.cli("run", f"{APP_NAME}/0", "status-detail", "--format=json")
+    task = juju.run(f"{APP_NAME}/0", "status-detail")
 
-    # Simple check for success indication
-    assert "completed" in cmd_output or "success" in cmd_output
+    assert task.status == "completed", f"Expected completed action, got {task.status}"
 
 
 def test_config_skip_immediately_propagation(juju: jubilant.Juju):
@@ -244,41 +211,35 @@ def test_config_skip_immediately_propagation(juju: jubilant.Juju):
 
     # Set skip-immediately to true
     juju.config(APP_NAME, {"skip-immediately": "true"})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    wait_for(juju, jubilant.all_agents_idle)
 
     # Verify via relation data on operator side
-    app_data = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec = json.loads(app_data["spec"])
+    spec = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
 
     assert spec.get("skip_immediately") is True
     logger.info("skip-immediately propagation verified: %s", spec.get("skip_immediately"))
 
     # Reset to default (false)
     juju.config(APP_NAME, {"skip-immediately": "false"})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    wait_for(juju, jubilant.all_agents_idle)
 
-    app_data = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec = json.loads(app_data["spec"])
+    spec = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
     assert spec.get("skip_immediately") is False
 
 
-def test_config_use_owner_references_propagation(juju: jubilant.Juju):
+def test_config_use_owner_references_propagation(
+    juju: jubilant.Juju, restore_config: dict[str, dict[str, str]]
+):
     """Test use-owner-references-in-backup configuration propagates."""
     logger.info("Testing use-owner-references-in-backup configuration")
+    restore_config[APP_NAME] = {"use-owner-references-in-backup": "false"}
 
     # Set use-owner-references-in-backup to true
     juju.config(APP_NAME, {"use-owner-references-in-backup": "true"})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    wait_for(juju, jubilant.all_agents_idle)
 
     # Verify via relation data on operator side
-    app_data = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec = json.loads(app_data["spec"])
+    spec = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
 
     assert spec.get("use_owner_references_in_backup") is True
     logger.info(
@@ -286,10 +247,6 @@ def test_config_use_owner_references_propagation(juju: jubilant.Juju):
         spec.get("use_owner_references_in_backup"),
     )
 
-    # Reset to default (false)
-    juju.config(APP_NAME, {"use-owner-references-in-backup": "false"})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
-
 
 def test_merged_data_from_target_and_integrator(juju: jubilant.Juju):
     """Test that final data on velero relation is merged from target spec and integrator config.
@@ -325,10 +282,7 @@ def test_merged_data_from_target_and_integrator(juju: jubilant.Juju):
     juju.wait(jubilant.all_agents_idle, timeout=120)
 
     # Get the final merged data from velero relation
-    app_data = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec = json.loads(app_data["spec"])
+    spec = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
 
     logger.info("Merged spec: %s", json.dumps(spec, indent=2))
 
@@ -366,23 +320,17 @@ def test_integrator_config_change_updates_velero_relation(juju: jubilant.Juju):
     logger.info("Testing integrator config change updates velero relation")
 
     # Get initial state
-    app_data_before = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec_before = json.loads(app_data_before["spec"])
+    spec_before = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
     schedule_before = spec_before.get("schedule")
     logger.info("Schedule before: %s", schedule_before)
 
     # Change schedule
     new_schedule = "0 5 * * *"
     juju.config(APP_NAME, {"schedule": new_schedule})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    wait_for(juju, jubilant.all_agents_idle)
 
     # Verify change propagated
-    app_data_after = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec_after = json.loads(app_data_after["spec"])
+    spec_after = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
 
     assert (
         spec_after.get("schedule") == new_schedule
@@ -395,10 +343,7 @@ def test_target_app_config_change_updates_velero_relation(juju: jubilant.Juju):
     logger.info("Testing target app config change updates velero relation")
 
     # Get initial state
-    app_data_before = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec_before = json.loads(app_data_before["spec"])
+    spec_before = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
     namespace_before = spec_before.get("include_namespaces")
     logger.info("Namespace before: %s", namespace_before)
 
@@ -408,10 +353,7 @@ def test_target_app_config_change_updates_velero_relation(juju: jubilant.Juju):
     juju.wait(jubilant.all_agents_idle, timeout=120)
 
     # Verify change propagated through integrator to velero
-    app_data_after = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec_after = json.loads(app_data_after["spec"])
+    spec_after = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
 
     assert spec_after.get("include_namespaces") == [
         new_namespace
@@ -425,25 +367,22 @@ def test_clear_schedule_switches_to_manual_mode(juju: jubilant.Juju):
 
     # Ensure we have a schedule first
     juju.config(APP_NAME, {"schedule": "0 6 * * *"})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    settled = juju.wait(jubilant.all_agents_idle, timeout=120)
 
-    status, message = get_unit_status(juju, APP_NAME)
+    status, message = get_unit_status(juju, APP_NAME, status=settled)
     assert "Schedule" in message or "0 6 * * *" in message
 
     # Clear the schedule
     juju.config(APP_NAME, {"schedule": ""})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    settled = juju.wait(jubilant.all_agents_idle, timeout=120)
 
     # Verify we're in manual mode
-    status, message = get_unit_status(juju, APP_NAME)
+    status, message = get_unit_status(juju, APP_NAME, status=settled)
     assert status == "active"
     assert "Manual" in message or "manual" in message.lower()
 
     # Verify velero relation data has no schedule (or null schedule)
-    app_data = get_application_data_from_relation(
-        juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION
-    )
-    spec = json.loads(app_data["spec"])
+    spec = get_backup_spec(juju, VELERO_OPERATOR_APP_NAME, VELERO_OPERATOR_BACKUP_RELATION)
     assert spec.get("schedule") is None or spec.get("schedule") == ""
 
     logger.info("Manual mode switch verified")
@@ -455,9 +394,9 @@ def test_paused_schedule_status_message(juju: jubilant.Juju):
 
     # Set schedule and pause it
     juju.config(APP_NAME, {"schedule": "0 7 * * *", "paused": "true"})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    settled = juju.wait(jubilant.all_agents_idle, timeout=120)
 
-    status, message = get_unit_status(juju, APP_NAME)
+    status, message = get_unit_status(juju, APP_NAME, status=settled)
     assert status == "active"
     assert "paused" in message.lower()
 
@@ -465,9 +404,9 @@ def test_paused_schedule_status_message(juju: jubilant.Juju):
 
     # Resume
     juju.config(APP_NAME, {"paused": "false"})
-    juju.wait(jubilant.all_agents_idle, timeout=120)
+    settled = juju.wait(jubilant.all_agents_idle, timeout=120)
 
-    status, message = get_unit_status(juju, APP_NAME)
+    status, message = get_unit_status(juju, APP_NAME, status=settled)
     assert status == "active"
     assert "Schedule" in message or "0 7 * * *" in message
 
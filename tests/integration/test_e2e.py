@@ -132,11 +132,13 @@ def test_integrate_all_e2e(juju: jubilant.Juju):
 
     # Wait for relations to be established
     juju.wait(
-        lambda status: is_relation_joined(juju, APP_NAME, INTEGRATOR_K8S_BACKUP_RELATION),
+        lambda status: is_relation_joined(juju, APP_NAME, INTEGRATOR_K8S_BACKUP_RELATION, status),
         timeout=120,
     )
     juju.wait(
-        lambda status: is_relation_joined(juju, APP_NAME, INTEGRATOR_VELERO_BACKUP_RELATION),
+        lambda status: is_relation_joined(
+            juju, APP_NAME, INTEGRATOR_VELERO_BACKUP_RELATION, status
+        ),
         timeout=120,
     )
 
@@ -150,13 +152,13 @@ def test_integrate_all_e2e(juju: jubilant.Juju):
     )
 
     # Wait for velero-integrator to become active
-    juju.wait(
+    settled = juju.wait(
         lambda status: status.apps[APP_NAME].units[f"{APP_NAME}/0"].workload_status.current
         == "active",
         timeout=TIMEOUT,
     )
 
-    status, message = get_unit_status(juju, APP_NAME)
+    status, message = get_unit_status(juju, APP_NAME, status=settled)
     assert status == "active", f"Expected active, got {status}: {message}"
     logger.info("All charms integrated and active")
 
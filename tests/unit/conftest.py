@@ -3,26 +3,29 @@
 
 """Test fixtures for unit tests."""
 
+import dataclasses
 import json
-import sys
 from pathlib import Path
 
 import pytest
 import yaml
 from ops.testing import Context, State
-from scenario import PeerRelation
+from scenario import PeerRelation, Relation
 
-# Add src and lib to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root / "src"))
-sys.path.insert(0, str(project_root / "lib"))
+from charm import VeleroIntegratorCharm
+from constants import (
+    K8S_BACKUP_TARGET_RELATION,
+    STATUS_PEERS_RELATION_NAME,
+    VELERO_BACKUP_RELATION,
+)
 
-from charm import VeleroIntegratorCharm  # noqa: E402
-from constants import STATUS_PEERS_RELATION_NAME  # noqa: E402
+# Use libyaml's C loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 # Load metadata files
-CHARMCRAFT = yaml.safe_load((project_root / "charmcraft.yaml").read_text())
-ACTIONS = yaml.safe_load((project_root / "actions.yaml").read_text())
+project_root = Path(__file__).parent.parent.parent
+CHARMCRAFT = yaml.load((project_root / "charmcraft.yaml").read_text(), Loader=YAML_LOADER)
+ACTIONS = yaml.load((project_root / "actions.yaml").read_text(), Loader=YAML_LOADER)
 
 # Build metadata dict from charmcraft.yaml
 METADATA = {
@@ -59,16 +62,59 @@ def ctx() -> Context:
     )
 
 
-@pytest.fixture
+# Relations and states are frozen and ctx.run works on a deep copy of its input,
+# so they are built once per module. ctx records each run and stays per test.
+@pytest.fixture(scope="module")
 def peer_relation() -> PeerRelation:
     """Create the status-peers relation required by the charm."""
     return PeerRelation(endpoint=STATUS_PEERS_RELATION_NAME)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def base_state(peer_relation) -> State:
     """Create a base state with status-peers relation."""
     return State(
         leader=True,
         relations=[peer_relation],
     )
+
+
+@pytest.fixture(scope="module")
+def make_state(base_state):
+    """Return a factory deriving states from base_state.
+
+    ``make_state(*relations, **changes)`` adds the given relations next to status-peers
+    and applies any other State field changes, such as ``config`` or ``leader``.
+    """
+
+    def _make_state(*relations: Relation, **changes) -> State:
+        return dataclasses.replace(
+            base_state, relations=[*base_state.relations, *relations], **changes
+        )
+
+    return _make_state
+
+
+@pytest.fixture(scope="module")
+def velero_relation() -> Relation:
+    """Create a velero-backup relation."""
+    return Relation(endpoint=VELERO_BACKUP_RELATION)
+
+
+@pytest.fixture(scope="module")
+def target_relation() -> Relation:
+    """Create a k8s-backup-target relation with a default backup target."""
+    return Relation(
+        endpoint=K8S_BACKUP_TARGET_RELATION,
+        remote_app_name="target-app",
+        remote_app_data=backup_target_app_data(),
+    )
+
+
+@pytest.fixture(scope="module")
+def full_state(make_state, velero_relation, target_relation) -> State:
+    """Create a leader state with status-peers, velero-backup and k8s-backup-target relations.
+
+    Tests needing a variant build it with ``make_state(velero_relation, target_relation, ...)``.
+    """
+    return make_state(velero_relation, target_relation)
@@ -4,10 +4,9 @@
 """Unit tests for VeleroIntegratorCharm."""
 
 from conftest import backup_target_app_data
-from ops import testing
 from scenario import Relation
 
-from constants import K8S_BACKUP_TARGET_RELATION, VELERO_BACKUP_RELATION
+from constants import K8S_BACKUP_TARGET_RELATION
 
 # Status messages
 MISSING_VELERO_RELATION_MESSAGE = "Missing relation: velero-backup"
@@ -18,28 +17,22 @@ INVALID_CONFIG_MESSAGE = "Invalid configuration:"
 STANDBY_MESSAGE = "Unit is ready (standby)"
 
 
-def test_missing_velero_backup_relation(ctx, peer_relation):
+def test_missing_velero_backup_relation(ctx, base_state):
     """Test that the charm is blocked when velero-backup relation is missing."""
     # Arrange & Act
-    state_out = ctx.run(
-        ctx.on.config_changed(),
-        testing.State(leader=True, relations=[peer_relation]),
-    )
+    state_out = ctx.run(ctx.on.config_changed(), base_state)
 
     # Assert
     assert state_out.unit_status.name == "blocked"
     assert MISSING_VELERO_RELATION_MESSAGE in state_out.unit_status.message
 
 
-def test_waiting_for_k8s_backup_target_relation(ctx, peer_relation):
+def test_waiting_for_k8s_backup_target_relation(ctx, make_state, velero_relation):
     """Test that the charm is waiting when k8s-backup-target relation is missing."""
-    # Arrange
-    velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-
     # Act
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(leader=True, relations=[peer_relation, velero_relation]),
+        make_state(velero_relation),
     )
 
     # Assert
@@ -47,48 +40,22 @@ def test_waiting_for_k8s_backup_target_relation(ctx, peer_relation):
     assert WAITING_K8S_BACKUP_RELATION_MESSAGE in state_out.unit_status.message
 
 
-def test_manual_backup_mode(ctx, peer_relation):
+def test_manual_backup_mode(ctx, full_state):
     """Test that the charm is active with manual backup message when no schedule."""
-    # Arrange
-    velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-    generic_relation = Relation(
-        endpoint=K8S_BACKUP_TARGET_RELATION,
-        remote_app_name="target-app",
-        remote_app_data=backup_target_app_data(),
-    )
-
     # Act
-    state_out = ctx.run(
-        ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation, generic_relation],
-        ),
-    )
+    state_out = ctx.run(ctx.on.config_changed(), full_state)
 
     # Assert
     assert state_out.unit_status.name == "active"
     assert MANUAL_BACKUP_MESSAGE in state_out.unit_status.message
 
 
-def test_schedule_active(ctx, peer_relation):
+def test_schedule_active(ctx, make_state, velero_relation, target_relation):
     """Test that the charm shows schedule in status when configured."""
-    # Arrange
-    velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-    generic_relation = Relation(
-        endpoint=K8S_BACKUP_TARGET_RELATION,
-        remote_app_name="target-app",
-        remote_app_data=backup_target_app_data(),
-    )
-
     # Act
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation, generic_relation],
-            config={"schedule": "0 2 * * *"},
-        ),
+        make_state(velero_relation, target_relation, config={"schedule": "0 2 * * *"}),
     )
 
     # Assert
@@ -96,23 +63,13 @@ def test_schedule_active(ctx, peer_relation):
     assert "Schedule: 0 2 * * *" in state_out.unit_status.message
 
 
-def test_schedule_paused(ctx, peer_relation):
+def test_schedule_paused(ctx, make_state, velero_relation, target_relation):
     """Test that the charm shows paused status when schedule is paused."""
-    # Arrange
-    velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-    generic_relation = Relation(
-        endpoint=K8S_BACKUP_TARGET_RELATION,
-        remote_app_name="target-app",
-        remote_app_data=backup_target_app_data(),
-    )
-
     # Act
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation, generic_relation],
-            config={"schedule": "0 2 * * *", "paused": True},
+        make_state(
+            velero_relation, target_relation, config={"schedule": "0 2 * * *", "paused": True}
         ),
     )
 
@@ -121,16 +78,12 @@ def test_schedule_paused(ctx, peer_relation):
     assert SCHEDULE_PAUSED_MESSAGE in state_out.unit_status.message
 
 
-def test_invalid_cron_expression(ctx, peer_relation):
+def test_invalid_cron_expression(ctx, make_state):
     """Test that the charm is blocked with invalid cron expression."""
     # Arrange & Act
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation],
-            config={"schedule": "invalid-cron"},
-        ),
+        make_state(config={"schedule": "invalid-cron"}),
     )
 
     # Assert
@@ -138,23 +91,19 @@ def test_invalid_cron_expression(ctx, peer_relation):
     assert INVALID_CONFIG_MESSAGE in state_out.unit_status.message
 
 
-def test_non_leader_standby(ctx, peer_relation):
+def test_non_leader_standby(ctx, make_state):
     """Test that non-leader units show standby status."""
     # Arrange & Act
-    state_out = ctx.run(
-        ctx.on.config_changed(),
-        testing.State(leader=False, relations=[peer_relation]),
-    )
+    state_out = ctx.run(ctx.on.config_changed(), make_state(leader=False))
 
     # Assert
     assert state_out.unit_status.name == "active"
     assert STANDBY_MESSAGE in state_out.unit_status.message
 
 
-def test_forward_backup_spec(ctx, peer_relation):
+def test_forward_backup_spec(ctx, make_state, velero_relation):
     """Test that backup specs are forwarded with schedule config merged."""
     # Arrange
-    velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
     generic_relation = Relation(
         endpoint=K8S_BACKUP_TARGET_RELATION,
         remote_app_name="target-app",
@@ -166,9 +115,9 @@ def test_forward_backup_spec(ctx, peer_relation):
     # Act
     state_out = ctx.run(
         ctx.on.relation_changed(generic_relation),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation, generic_relation],
+        make_state(
+            velero_relation,
+            generic_relation,
             config={
                 "schedule": "0 2 * * *",
                 "paused": False,
@@ -190,33 +139,18 @@ def test_forward_backup_spec(ctx, peer_relation):
     assert "0 2 * * *" in local_app_data.get("spec", "")
 
 
-def test_relation_changed_triggers_reconcile(ctx, peer_relation):
+def test_relation_changed_triggers_reconcile(ctx, full_state, velero_relation):
     """Test that relation_changed events trigger reconciliation."""
-    # Arrange
-    velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-    generic_relation = Relation(
-        endpoint=K8S_BACKUP_TARGET_RELATION,
-        remote_app_name="target-app",
-        remote_app_data=backup_target_app_data(),
-    )
-
     # Act
-    state_out = ctx.run(
-        ctx.on.relation_changed(velero_relation),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation, generic_relation],
-        ),
-    )
+    state_out = ctx.run(ctx.on.relation_changed(velero_relation), full_state)
 
     # Assert
     assert state_out.unit_status.name == "active"
 
 
-def test_no_spec_data_skips_forwarding(ctx, peer_relation):
+def test_no_spec_data_skips_forwarding(ctx, make_state, velero_relation):
     """Test that relations without valid backup_targets data are skipped."""
     # Arrange
-    velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
     generic_relation = Relation(
         endpoint=K8S_BACKUP_TARGET_RELATION,
         remote_app_name="target-app",
@@ -226,10 +160,7 @@ def test_no_spec_data_skips_forwarding(ctx, peer_relation):
     # Act
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation, generic_relation],
-        ),
+        make_state(velero_relation, generic_relation),
     )
 
     # Assert - should still be active but no data forwarded
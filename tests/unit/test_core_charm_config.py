@@ -3,18 +3,10 @@
 
 """Unit tests for CharmConfig."""
 
-import sys
-from pathlib import Path
-
 import pytest
 from pydantic import ValidationError
 
-# Add src and lib to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root / "src"))
-sys.path.insert(0, str(project_root / "lib"))
-
-from core.charm_config import CharmConfig, CharmConfigInvalidError  # noqa: E402
+from core.charm_config import CharmConfig, CharmConfigInvalidError
 
 
 class TestCharmConfigInvalidError:
@@ -45,42 +37,38 @@ class TestCharmConfig:
         assert config.skip_immediately is False
         assert config.use_owner_references_in_backup is False
 
-    def test_valid_cron_expression_5_fields(self):
-        """Test valid 5-field cron expression."""
-        config = CharmConfig(schedule="0 2 * * *")
-        assert config.schedule == "0 2 * * *"
-
-    def test_valid_cron_expression_6_fields(self):
-        """Test valid 6-field cron expression."""
-        config = CharmConfig(schedule="0 0 2 * * *")
-        assert config.schedule == "0 0 2 * * *"
-
-    def test_valid_cron_with_ranges(self):
-        """Test cron expression with ranges."""
-        config = CharmConfig(schedule="0-30 2-5 * * 1-5")
-        assert config.schedule == "0-30 2-5 * * 1-5"
-
-    def test_valid_cron_with_step(self):
-        """Test cron expression with step values."""
-        config = CharmConfig(schedule="*/15 * * * *")
-        assert config.schedule == "*/15 * * * *"
-
-    def test_valid_cron_with_lists(self):
-        """Test cron expression with comma-separated lists."""
-        config = CharmConfig(schedule="0 2,14 * * *")
-        assert config.schedule == "0 2,14 * * *"
-
-    def test_invalid_cron_expression(self):
-        """Test that invalid cron expression raises ValidationError."""
+    def test_default_matches_validated_defaults(self):
+        """Test that the unvalidated default config equals a validated one."""
+        assert CharmConfig.default() == CharmConfig()
+
+    @pytest.mark.parametrize(
+        "schedule",
+        [
+            pytest.param("0 2 * * *", id="5-fields"),
+            pytest.param("0 0 2 * * *", id="6-fields"),
+            pytest.param("0-30 2-5 * * 1-5", id="ranges"),
+            pytest.param("*/15 * * * *", id="step"),
+            pytest.param("0 2,14 * * *", id="lists"),
+        ],
+    )
+    def test_valid_cron_expression(self, schedule):
+        """Test that valid cron expressions are accepted unchanged."""
+        config = CharmConfig(schedule=schedule)
+        assert config.schedule == schedule
+
+    @pytest.mark.parametrize(
+        "schedule",
+        [
+            pytest.param("invalid-cron", id="not-cron"),
+            pytest.param("0 2 *", id="too-few-fields"),
+        ],
+    )
+    def test_invalid_cron_expression(self, schedule):
+        """Test that invalid cron expressions raise ValidationError."""
         with pytest.raises(ValidationError) as exc_info:
-            CharmConfig(schedule="invalid-cron")
+            CharmConfig(schedule=schedule)
         assert "Invalid cron expression" in str(exc_info.value)
 
-    def test_invalid_cron_too_few_fields(self):
-        """Test cron expression with too few fields."""
-        with pytest.raises(ValidationError):
-            CharmConfig(schedule="0 2 *")
-
     def test_empty_string_schedule_becomes_none(self):
         """Test that empty string schedule is converted to None."""
         config = CharmConfig(schedule="")
@@ -6,39 +6,30 @@
 from unittest.mock import MagicMock, PropertyMock, patch
 
 from conftest import backup_target_app_data
-from ops import testing
 from scenario import Relation
 
 from constants import K8S_BACKUP_TARGET_RELATION, VELERO_BACKUP_RELATION
-from core.context import Context
+from core.context import Context, _config_option_name
 
 
-def test_config_returns_valid_config(ctx, peer_relation):
+def test_config_returns_valid_config(ctx, make_state):
     """Test that context.config returns valid CharmConfig."""
     velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
 
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation],
-            config={"schedule": "0 2 * * *", "paused": True},
-        ),
+        make_state(velero_relation, config={"schedule": "0 2 * * *", "paused": True}),
     )
 
     # If we get active status, config was parsed successfully
     assert state_out.unit_status.name in ("active", "waiting")
 
 
-def test_config_returns_none_for_invalid_config(ctx, peer_relation):
+def test_config_returns_none_for_invalid_config(ctx, make_state):
     """Test that context.config returns None for invalid config."""
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation],
-            config={"schedule": "invalid-cron"},
-        ),
+        make_state(config={"schedule": "invalid-cron"}),
     )
 
     # Invalid config should result in blocked status
@@ -46,38 +37,31 @@ def test_config_returns_none_for_invalid_config(ctx, peer_relation):
     assert "Invalid configuration" in state_out.unit_status.message
 
 
-def test_config_errors_returns_invalid_fields(ctx, peer_relation):
+def test_config_errors_returns_invalid_fields(ctx, make_state):
     """Test that config_errors returns list of invalid field names."""
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation],
-            config={"schedule": "bad-cron"},
-        ),
+        make_state(config={"schedule": "bad-cron"}),
     )
 
     assert state_out.unit_status.name == "blocked"
     assert "Invalid configuration" in state_out.unit_status.message
 
 
-def test_velero_relations_returns_list(ctx, peer_relation):
+def test_velero_relations_returns_list(ctx, make_state):
     """Test that velero_relations returns list of relations."""
     velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
 
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation],
-        ),
+        make_state(velero_relation),
     )
 
     # If velero relation exists, should not be blocked for missing relation
     assert "Missing relation: velero-backup" not in state_out.unit_status.message
 
 
-def test_k8s_backup_relations_returns_list(ctx, peer_relation):
+def test_k8s_backup_relations_returns_list(ctx, make_state):
     """Test that k8s_backup_relations returns list of relations."""
     velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
     k8s_relation = Relation(
@@ -88,47 +72,38 @@ def test_k8s_backup_relations_returns_list(ctx, peer_relation):
 
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation, k8s_relation],
-        ),
+        make_state(velero_relation, k8s_relation),
     )
 
     # With k8s-backup-target relation, should be active
     assert state_out.unit_status.name == "active"
 
 
-def test_has_velero_relation_true(ctx, peer_relation):
+def test_has_velero_relation_true(ctx, make_state):
     """Test has_velero_relation returns True when relation exists."""
     velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
 
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation],
-        ),
+        make_state(velero_relation),
     )
 
     # Should not show missing velero relation error
     assert "Missing relation: velero-backup" not in state_out.unit_status.message
 
 
-def test_has_velero_relation_false(ctx, peer_relation):
+def test_has_velero_relation_false(ctx, make_state):
     """Test has_velero_relation returns False when relation missing."""
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation],
-        ),
+        make_state(),
     )
 
     assert state_out.unit_status.name == "blocked"
     assert "Missing relation: velero-backup" in state_out.unit_status.message
 
 
-def test_has_k8s_backup_relation_true(ctx, peer_relation):
+def test_has_k8s_backup_relation_true(ctx, make_state):
     """Test has_k8s_backup_relation returns True when relation exists."""
     velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
     k8s_relation = Relation(
@@ -139,33 +114,27 @@ def test_has_k8s_backup_relation_true(ctx, peer_relation):
 
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation, k8s_relation],
-        ),
+        make_state(velero_relation, k8s_relation),
     )
 
     # Should not show waiting for k8s-backup-target
     assert "Waiting for k8s-backup-target" not in state_out.unit_status.message
 
 
-def test_has_k8s_backup_relation_false(ctx, peer_relation):
+def test_has_k8s_backup_relation_false(ctx, make_state):
     """Test has_k8s_backup_relation returns False when relation missing."""
     velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
 
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation],
-        ),
+        make_state(velero_relation),
     )
 
     assert state_out.unit_status.name == "waiting"
     assert "Waiting for k8s-backup-target" in state_out.unit_status.message
 
 
-def test_get_backup_targets_returns_valid_targets(ctx, peer_relation):
+def test_get_backup_targets_returns_valid_targets(ctx, make_state):
     """Test get_backup_targets returns list of BackupTargetInfo."""
     velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
     k8s_relation = Relation(
@@ -176,10 +145,7 @@ def test_get_backup_targets_returns_valid_targets(ctx, peer_relation):
 
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation, k8s_relation],
-        ),
+        make_state(velero_relation, k8s_relation),
     )
 
     # Data should be forwarded to velero relation
@@ -187,7 +153,7 @@ def test_get_backup_targets_returns_valid_targets(ctx, peer_relation):
     assert "spec" in velero_rel_out.local_app_data
 
 
-def test_get_backup_targets_skips_invalid_spec(ctx, peer_relation):
+def test_get_backup_targets_skips_invalid_spec(ctx, make_state):
     """Test get_backup_targets skips relations with invalid data."""
     velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
     k8s_relation = Relation(
@@ -198,10 +164,7 @@ def test_get_backup_targets_skips_invalid_spec(ctx, peer_relation):
 
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation, k8s_relation],
-        ),
+        make_state(velero_relation, k8s_relation),
     )
 
     # Should still be active, just no data forwarded
@@ -210,7 +173,7 @@ def test_get_backup_targets_skips_invalid_spec(ctx, peer_relation):
     assert "spec" not in velero_rel_out.local_app_data
 
 
-def test_get_backup_targets_skips_invalid_entry_structure(ctx, peer_relation):
+def test_get_backup_targets_skips_invalid_entry_structure(ctx, make_state):
     """Test get_backup_targets skips relations with valid JSON but invalid entry schema."""
     import json
 
@@ -223,10 +186,7 @@ def test_get_backup_targets_skips_invalid_entry_structure(ctx, peer_relation):
 
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation, k8s_relation],
-        ),
+        make_state(velero_relation, k8s_relation),
     )
 
     assert state_out.unit_status.name == "active"
@@ -234,7 +194,7 @@ def test_get_backup_targets_skips_invalid_entry_structure(ctx, peer_relation):
     assert "spec" not in velero_rel_out.local_app_data
 
 
-def test_get_backup_targets_skips_missing_spec(ctx, peer_relation):
+def test_get_backup_targets_skips_missing_spec(ctx, make_state):
     """Test get_backup_targets skips relations without backup_targets field."""
     velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
     k8s_relation = Relation(
@@ -245,10 +205,7 @@ def test_get_backup_targets_skips_missing_spec(ctx, peer_relation):
 
     state_out = ctx.run(
         ctx.on.config_changed(),
-        testing.State(
-            leader=True,
-            relations=[peer_relation, velero_relation, k8s_relation],
-        ),
+        make_state(velero_relation, k8s_relation),
     )
 
     assert state_out.unit_status.name == "active"
@@ -297,3 +254,44 @@ def test_get_backup_targets_skips_relation_without_app():
 
     # Should return empty list since relation.app is None
     assert targets == []
+
+
+def test_config_validated_once_per_context():
+    """Test that config and config_errors share a single validation pass."""
+    mock_charm = MagicMock()
+    mock_charm.config.get.side_effect = lambda key, default=None: {
+        "schedule": "invalid-cron-expression",
+    }.get(key, default)
+
+    with patch.object(Context, "__init__", lambda self, charm: None):
+        context = Context.__new__(Context)
+        context.charm = mock_charm
+
+        assert context.config is None
+        assert context.config_errors
+        assert context.config_errors is context.config_errors
+
+    # One read per config option, regardless of how many properties were accessed
+    assert mock_charm.config.get.call_count == 4
+
+
+def test_config_errors_report_invalid_boolean_option():
+    """Test that non-boolean values are reported under the Juju option name."""
+    mock_charm = MagicMock()
+    mock_charm.config.get.side_effect = lambda key, default=None: {
+        "skip-immediately": "not-a-bool",
+    }.get(key, default)
+
+    with patch.object(Context, "__init__", lambda self, charm: None):
+        context = Context.__new__(Context)
+        context.charm = mock_charm
+
+        assert context.config is None
+        assert context.config_errors == ["skip-immediately"]
+
+
+def test_config_option_name_maps_error_locations():
+    """Test that pydantic error locations map to Juju config option names."""
+    assert _config_option_name(("skip_immediately",)) == "skip-immediately"
+    assert _config_option_name(("label_selector", "app_name")) == "label-selector.app-name"
+    assert _config_option_name(()) == ""
@@ -3,43 +3,53 @@
 
 """Unit tests for domain models."""
 
-import sys
-from pathlib import Path
+import dataclasses
+import json
 from unittest.mock import MagicMock
 
 import pytest
+from charmlibs.interfaces.k8s_backup_target import K8sBackupTargetSpec
+from pydantic import ValidationError
 
-# Add src to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root / "src"))
-
-from charmlibs.interfaces.k8s_backup_target import K8sBackupTargetSpec  # noqa: E402
-
-from core.charm_config import CharmConfig  # noqa: E402
-from core.domain import (  # noqa: E402
+from core.charm_config import CharmConfig
+from core.domain import (
     APP_FIELD,
     MODEL_FIELD,
     RELATION_FIELD,
     SPEC_FIELD,
     BackupTargetInfo,
+    parse_backup_targets,
 )
 
+# Shared configurations, validated once at import
+DEFAULT_CONFIG = CharmConfig.default()
+SCHEDULED_CONFIG = CharmConfig(schedule="0 2 * * *")
+FULL_CONFIG = CharmConfig(
+    schedule="0 2 * * *",
+    paused=True,
+    skip_immediately=True,
+    use_owner_references_in_backup=True,
+)
 
-class TestBackupTargetInfo:
-    """Tests for BackupTargetInfo dataclass."""
 
-    @pytest.fixture
-    def mock_relation(self):
-        """Create a mock relation object."""
-        relation = MagicMock()
-        relation.app.name = "remote-app"
-        relation.name = "k8s-backup-target"
-        return relation
+# Nothing mutates the relation or the spec, so one instance serves the whole module
+@pytest.fixture(scope="module")
+def mock_relation():
+    """Create a mock relation object."""
+    relation = MagicMock()
+    relation.app.name = "remote-app"
+    relation.name = "k8s-backup-target"
+    return relation
 
-    @pytest.fixture
-    def valid_spec(self):
-        """Create a valid K8sBackupTargetSpec."""
-        return K8sBackupTargetSpec(include_namespaces=["test-namespace"])
+
+@pytest.fixture(scope="module")
+def valid_spec():
+    """Create a valid K8sBackupTargetSpec."""
+    return K8sBackupTargetSpec(include_namespaces=["test-namespace"])
+
+
+class TestBackupTargetInfo:
+    """Tests for BackupTargetInfo dataclass."""
 
     @pytest.fixture
     def valid_target(self, valid_spec, mock_relation):
@@ -59,11 +69,14 @@ class TestBackupTargetInfo:
         assert valid_target.model_name == "my-model"
         assert valid_target.spec.include_namespaces == ["test-namespace"]
 
+    def test_backup_target_info_is_immutable(self, valid_target):
+        """Test that BackupTargetInfo fields cannot be reassigned."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            valid_target.app_name = "other-app"  # type: ignore[misc]
+
     def test_to_velero_spec_without_schedule(self, valid_target):
         """Test converting to VeleroBackupSpec without schedule."""
-        config = CharmConfig(paused=False, skip_immediately=False)
-
-        velero_spec = valid_target.to_velero_spec(config)
+        velero_spec = valid_target.to_velero_spec(DEFAULT_CONFIG)
 
         assert velero_spec.schedule is None
         assert velero_spec.paused is False
@@ -72,14 +85,7 @@ class TestBackupTargetInfo:
 
     def test_to_velero_spec_with_schedule(self, valid_target):
         """Test converting to VeleroBackupSpec with schedule."""
-        config = CharmConfig(
-            schedule="0 2 * * *",
-            paused=True,
-            skip_immediately=True,
-            use_owner_references_in_backup=True,
-        )
-
-        velero_spec = valid_target.to_velero_spec(config)
+        velero_spec = valid_target.to_velero_spec(FULL_CONFIG)
 
         assert velero_spec.schedule == "0 2 * * *"
         assert velero_spec.paused is True
@@ -96,18 +102,28 @@ class TestBackupTargetInfo:
             model_name="model",
             relation=mock_relation,
         )
-        config = CharmConfig(schedule="0 2 * * *")
-
-        velero_spec = target.to_velero_spec(config)
+        velero_spec = target.to_velero_spec(SCHEDULED_CONFIG)
 
         assert velero_spec.include_namespaces == ["ns1", "ns2"]
         assert velero_spec.ttl == "24h"
         assert velero_spec.schedule == "0 2 * * *"
 
+    def test_to_velero_spec_rejects_invalid_ttl(self, mock_relation):
+        """Test that a TTL the upstream spec accepts but velero rejects fails validation."""
+        target = BackupTargetInfo(
+            spec=K8sBackupTargetSpec(include_namespaces=["ns"], ttl="30d"),
+            app_name="app",
+            relation_name="backup",
+            model_name="model",
+            relation=mock_relation,
+        )
+
+        with pytest.raises(ValidationError):
+            target.to_velero_spec(DEFAULT_CONFIG)
+
     def test_to_databag_dict(self, valid_target):
         """Test creating databag dictionary."""
-        config = CharmConfig(schedule="0 2 * * *")
-        velero_spec = valid_target.to_velero_spec(config)
+        velero_spec = valid_target.to_velero_spec(SCHEDULED_CONFIG)
 
         databag = valid_target.to_databag_dict(velero_spec)
 
@@ -121,3 +137,31 @@ class TestBackupTargetInfo:
         # Verify spec is JSON string
         assert isinstance(databag[SPEC_FIELD], str)
         assert "0 2 * * *" in databag[SPEC_FIELD]
+
+
+class TestParseBackupTargets:
+    """Tests for parse_backup_targets."""
+
+    def test_parses_entries(self):
+        """Test that valid JSON is parsed into backup target entries."""
+        raw = json.dumps(
+            [
+                {
+                    "app": "my-app",
+                    "model": "my-model",
+                    "relation_name": "backup",
+                    "spec": {"include_namespaces": ["ns"]},
+                }
+            ]
+        )
+
+        entries = parse_backup_targets(raw)
+
+        assert len(entries) == 1
+        assert entries[0].app == "my-app"
+        assert entries[0].spec.include_namespaces == ["ns"]
+
+    def test_invalid_json_raises(self):
+        """Test that malformed JSON raises a validation error."""
+        with pytest.raises(ValidationError):
+            parse_backup_targets("invalid-json{")
@@ -5,359 +5,163 @@
 
 from unittest.mock import MagicMock, PropertyMock, patch
 
+import ops
+import pytest
 from conftest import backup_target_app_data
-from ops import testing
 from scenario import Relation
 
-from constants import K8S_BACKUP_TARGET_RELATION, VELERO_BACKUP_RELATION
+from constants import K8S_BACKUP_TARGET_RELATION
 from events.velero_backup import VeleroBackupEvents
 
 
-class TestGeneralEvents:
-    """Tests for GeneralEvents handler."""
-
-    def test_config_changed_as_leader(self, ctx, peer_relation):
-        """Test config_changed event as leader."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
-
-        state_out = ctx.run(
-            ctx.on.config_changed(),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation, k8s_relation],
-            ),
-        )
-
-        assert state_out.unit_status.name == "active"
-
-    def test_config_changed_as_non_leader(self, ctx, peer_relation):
-        """Test config_changed event as non-leader."""
-        state_out = ctx.run(
-            ctx.on.config_changed(),
-            testing.State(
-                leader=False,
-                relations=[peer_relation],
-            ),
-        )
-
-        assert state_out.unit_status.name == "active"
-        assert "standby" in state_out.unit_status.message.lower()
-
-    def test_upgrade_charm_as_leader(self, ctx, peer_relation):
-        """Test upgrade_charm event as leader."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
-
-        state_out = ctx.run(
-            ctx.on.upgrade_charm(),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation, k8s_relation],
-            ),
-        )
+@pytest.mark.parametrize(
+    ("event_name", "relation_name"),
+    [
+        ("update_status", None),
+        ("relation_created", "target_relation"),
+        ("relation_joined", "target_relation"),
+        ("relation_created", "velero_relation"),
+        ("relation_changed", "velero_relation"),
+    ],
+)
+def test_leader_event_sets_active_status(ctx, full_state, request, event_name, relation_name):
+    """Test that events handled by the leader with all relations set reach active status."""
+    event_factory = getattr(ctx.on, event_name)
+    if relation_name:
+        event = event_factory(request.getfixturevalue(relation_name))
+    else:
+        event = event_factory()
 
-        assert state_out.unit_status.name == "active"
+    state_out = ctx.run(event, full_state)
 
-    def test_upgrade_charm_as_non_leader(self, ctx, peer_relation):
-        """Test upgrade_charm event as non-leader."""
-        state_out = ctx.run(
-            ctx.on.upgrade_charm(),
-            testing.State(
-                leader=False,
-                relations=[peer_relation],
-            ),
-        )
+    assert state_out.unit_status.name == "active"
 
-        assert state_out.unit_status.name == "active"
-        assert "standby" in state_out.unit_status.message.lower()
 
-    def test_update_status(self, ctx, peer_relation):
-        """Test update_status event."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
+class TestGeneralEvents:
+    """Tests for GeneralEvents handler."""
 
+    @pytest.mark.parametrize("event_name", ["config_changed", "upgrade_charm"])
+    @pytest.mark.parametrize("leader", [True, False])
+    def test_status_by_leadership(
+        self, ctx, make_state, velero_relation, target_relation, event_name, leader
+    ):
+        """Test that the leader reconciles to active and other units report standby."""
         state_out = ctx.run(
-            ctx.on.update_status(),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation, k8s_relation],
-            ),
+            getattr(ctx.on, event_name)(),
+            make_state(velero_relation, target_relation, leader=leader),
         )
 
         assert state_out.unit_status.name == "active"
+        assert ("standby" in state_out.unit_status.message.lower()) is not leader
 
 
 class TestK8sBackupTargetEvents:
     """Tests for K8sBackupTargetEvents handler."""
 
-    def test_relation_created(self, ctx, peer_relation):
-        """Test k8s-backup-target relation created event."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
-
+    @pytest.mark.parametrize("leader", [True, False])
+    def test_relation_changed(self, ctx, make_state, velero_relation, target_relation, leader):
+        """Test that only the leader forwards the spec on relation changed."""
         state_out = ctx.run(
-            ctx.on.relation_created(k8s_relation),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation, k8s_relation],
-            ),
+            ctx.on.relation_changed(target_relation),
+            make_state(velero_relation, target_relation, leader=leader),
         )
 
         assert state_out.unit_status.name == "active"
-
-    def test_relation_joined(self, ctx, peer_relation):
-        """Test k8s-backup-target relation joined event."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
-
-        state_out = ctx.run(
-            ctx.on.relation_joined(k8s_relation),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation, k8s_relation],
-            ),
-        )
-
-        assert state_out.unit_status.name == "active"
-
-    def test_relation_changed(self, ctx, peer_relation):
-        """Test k8s-backup-target relation changed event."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
-
-        state_out = ctx.run(
-            ctx.on.relation_changed(k8s_relation),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation, k8s_relation],
-            ),
-        )
-
-        assert state_out.unit_status.name == "active"
-        # Data should be forwarded
         velero_rel_out = state_out.get_relation(velero_relation.id)
-        assert "spec" in velero_rel_out.local_app_data
+        assert ("spec" in velero_rel_out.local_app_data) is leader
 
-    def test_relation_broken(self, ctx, peer_relation):
+    def test_relation_broken(self, ctx, full_state, target_relation):
         """Test k8s-backup-target relation broken event."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
-
-        state_out = ctx.run(
-            ctx.on.relation_broken(k8s_relation),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation, k8s_relation],
-            ),
-        )
+        state_out = ctx.run(ctx.on.relation_broken(target_relation), full_state)
 
         # Should be waiting since no more k8s-backup relations
         assert state_out.unit_status.name == "waiting"
 
-    def test_relation_events_as_non_leader(self, ctx, peer_relation):
-        """Test that non-leader doesn't publish."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
-
-        state_out = ctx.run(
-            ctx.on.relation_changed(k8s_relation),
-            testing.State(
-                leader=False,
-                relations=[peer_relation, velero_relation, k8s_relation],
-            ),
-        )
-
-        # Non-leader should not write to velero relation
-        velero_rel_out = state_out.get_relation(velero_relation.id)
-        assert "spec" not in velero_rel_out.local_app_data
-
 
 class TestVeleroBackupEvents:
     """Tests for VeleroBackupEvents handler."""
 
-    def test_relation_created(self, ctx, peer_relation):
-        """Test velero-backup relation created event."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
-
-        state_out = ctx.run(
-            ctx.on.relation_created(velero_relation),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation, k8s_relation],
-            ),
-        )
-
-        assert state_out.unit_status.name == "active"
-
-    def test_relation_joined(self, ctx, peer_relation):
+    def test_relation_joined(self, ctx, full_state, velero_relation):
         """Test velero-backup relation joined event."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
-
-        state_out = ctx.run(
-            ctx.on.relation_joined(velero_relation),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation, k8s_relation],
-            ),
-        )
+        state_out = ctx.run(ctx.on.relation_joined(velero_relation), full_state)
 
         assert state_out.unit_status.name == "active"
         velero_rel_out = state_out.get_relation(velero_relation.id)
         assert "spec" in velero_rel_out.local_app_data
 
-    def test_relation_changed(self, ctx, peer_relation):
-        """Test velero-backup relation changed event."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
-
-        state_out = ctx.run(
-            ctx.on.relation_changed(velero_relation),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation, k8s_relation],
-            ),
-        )
-
-        assert state_out.unit_status.name == "active"
-
-    def test_relation_broken(self, ctx, peer_relation):
+    def test_relation_broken(self, ctx, make_state, velero_relation):
         """Test velero-backup relation broken event."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-
-        state_out = ctx.run(
-            ctx.on.relation_broken(velero_relation),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation],
-            ),
-        )
+        state_out = ctx.run(ctx.on.relation_broken(velero_relation), make_state(velero_relation))
 
         # Should be blocked after velero relation is broken
         assert state_out.unit_status.name == "blocked"
         assert "Missing relation" in state_out.unit_status.message
 
-    def test_publish_skips_invalid_config(self, ctx, peer_relation):
-        """Test that publishing skips when config is invalid."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
-
-        state_out = ctx.run(
-            ctx.on.config_changed(),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation, k8s_relation],
-                config={"schedule": "invalid-cron"},
-            ),
-        )
-
-        # Should be blocked due to invalid config
-        assert state_out.unit_status.name == "blocked"
-
-    def test_publish_as_non_leader(self, ctx, peer_relation):
-        """Test that non-leader doesn't publish."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation = Relation(
-            endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="target-app",
-            remote_app_data=backup_target_app_data(),
-        )
-
+    @pytest.mark.parametrize(
+        ("changes", "published", "status"),
+        [
+            ({}, True, "active"),
+            ({"config": {"schedule": "invalid-cron"}}, False, "blocked"),
+            ({"leader": False}, False, "active"),
+        ],
+        ids=["leader", "invalid-config", "non-leader"],
+    )
+    def test_publish(
+        self, ctx, make_state, velero_relation, target_relation, changes, published, status
+    ):
+        """Test that the spec is published only by the leader with a valid config."""
         state_out = ctx.run(
             ctx.on.relation_changed(velero_relation),
-            testing.State(
-                leader=False,
-                relations=[peer_relation, velero_relation, k8s_relation],
-            ),
+            make_state(velero_relation, target_relation, **changes),
         )
 
+        assert state_out.unit_status.name == status
         velero_rel_out = state_out.get_relation(velero_relation.id)
-        assert "spec" not in velero_rel_out.local_app_data
+        assert ("spec" in velero_rel_out.local_app_data) is published
 
 
 class TestMultipleBackupTargets:
     """Tests for handling multiple backup targets."""
 
-    def test_multiple_k8s_backup_targets(self, ctx, peer_relation):
+    @pytest.mark.parametrize("n_targets", [1, 2, 5])
+    def test_multiple_k8s_backup_targets(self, ctx, make_state, velero_relation, n_targets):
         """Test handling multiple k8s-backup-target relations."""
-        velero_relation = Relation(endpoint=VELERO_BACKUP_RELATION)
-        k8s_relation1 = Relation(
+        k8s_relations = [
+            Relation(
+                endpoint=K8S_BACKUP_TARGET_RELATION,
+                remote_app_name=f"app{i}",
+                remote_app_data=backup_target_app_data(
+                    app=f"app{i}", spec={"include_namespaces": [f"ns{i}"]}
+                ),
+            )
+            for i in range(n_targets)
+        ]
+
+        state_out = ctx.run(ctx.on.config_changed(), make_state(velero_relation, *k8s_relations))
+
+        assert state_out.unit_status.name == "active"
+        # Targets share the databag keys, so one of them ends up published
+        velero_rel_out = state_out.get_relation(velero_relation.id)
+        assert velero_rel_out.local_app_data["app"] in {f"app{i}" for i in range(n_targets)}
+
+    def test_invalid_target_spec_blocks(self, ctx, make_state, velero_relation):
+        """Test that a target with an invalid spec is skipped and reported in the status."""
+        valid = Relation(
             endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="app1",
-            remote_app_data=backup_target_app_data(
-                app="app1", spec={"include_namespaces": ["ns1"]}
-            ),
+            remote_app_name="good-app",
+            remote_app_data=backup_target_app_data(app="good-app", spec={"ttl": "24h"}),
         )
-        k8s_relation2 = Relation(
+        invalid = Relation(
             endpoint=K8S_BACKUP_TARGET_RELATION,
-            remote_app_name="app2",
-            remote_app_data=backup_target_app_data(
-                app="app2", spec={"include_namespaces": ["ns2"]}
-            ),
+            remote_app_name="bad-app",
+            remote_app_data=backup_target_app_data(app="bad-app", spec={"ttl": "30d"}),
         )
 
-        state_out = ctx.run(
-            ctx.on.config_changed(),
-            testing.State(
-                leader=True,
-                relations=[peer_relation, velero_relation, k8s_relation1, k8s_relation2],
-            ),
-        )
+        state_out = ctx.run(ctx.on.config_changed(), make_state(velero_relation, valid, invalid))
 
-        assert state_out.unit_status.name == "active"
-        # Both targets should be published
+        assert state_out.unit_status == ops.BlockedStatus("Invalid backup spec from: bad-app")
         velero_rel_out = state_out.get_relation(velero_relation.id)
-        assert "spec" in velero_rel_out.local_app_data
+        assert velero_rel_out.local_app_data["app"] == "good-app"
 
 
 class TestVeleroBackupEventsDirectCoverage:
@@ -422,3 +226,41 @@ class TestVeleroBackupEventsDirectCoverage:
 
             # Should not access velero_relations since non-leader returns early
             mock_context.velero_relations.assert_not_called()
+
+    def test_publish_to_all_relations_checks_leadership_once(self):
+        """Test that leadership, config and targets are resolved once for all relations."""
+        mock_charm = MagicMock()
+        mock_charm.unit.is_leader.return_value = True
+        mock_context = MagicMock()
+        mock_context.velero_relations = [MagicMock(), MagicMock()]
+        mock_context.backup_targets = []
+
+        with patch.object(VeleroBackupEvents, "__init__", lambda self, c, ctx: None):
+            handler = VeleroBackupEvents.__new__(VeleroBackupEvents)
+            handler.charm = mock_charm
+            handler.context = mock_context
+
+            handler.publish_to_all_relations()
+
+        mock_charm.unit.is_leader.assert_called_once()
+        # No targets means nothing to write
+        for relation in mock_context.velero_relations:
+            relation.data.__getitem__.assert_not_called()
+
+    def test_write_databag_skips_unchanged_data(self):
+        """Test that only changed keys are written, and nothing when up to date."""
+        mock_charm = MagicMock()
+        current = MagicMock()
+        current.get.side_effect = {"app": "target-app", "spec": "{}"}.get
+        mock_relation = MagicMock()
+        mock_relation.data.__getitem__.return_value = current
+
+        with patch.object(VeleroBackupEvents, "__init__", lambda self, c, ctx: None):
+            handler = VeleroBackupEvents.__new__(VeleroBackupEvents)
+            handler.charm = mock_charm
+
+            handler._write_databag(mock_relation, {"app": "target-app", "spec": "{}"})
+            current.update.assert_not_called()
+
+            handler._write_databag(mock_relation, {"app": "target-app", "spec": '{"a": 1}'})
+            current.update.assert_called_once_with({"spec": '{"a": 1}'})
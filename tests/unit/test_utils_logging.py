@@ -4,37 +4,51 @@
 """Unit tests for logging utilities."""
 
 import logging
-import sys
-from pathlib import Path
+import types
 
-# Add src and lib to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root / "src"))
-sys.path.insert(0, str(project_root / "lib"))
+import pytest
 
-from utils.logging import WithLogging  # noqa: E402
+from utils.logging import WithLogging
+
+
+@pytest.fixture(scope="module")
+def logging_class():
+    """Return a WithLogging subclass shared by the tests of this module."""
+
+    class MyClass(WithLogging):
+        pass
+
+    return MyClass
+
+
+@pytest.fixture
+def make_logging_class():
+    """Return a factory creating WithLogging subclasses owned by this module."""
+
+    def _make_logging_class(name: str) -> type[WithLogging]:
+        return types.new_class(
+            name, (WithLogging,), exec_body=lambda ns: ns.update(__module__=__name__)
+        )
+
+    return _make_logging_class
 
 
 class TestWithLogging:
     """Tests for WithLogging mixin."""
 
-    def test_logger_returns_logger_instance(self):
+    def test_logger_returns_logger_instance(self, logging_class):
         """Test that logger property returns a Logger instance."""
-
-        class MyClass(WithLogging):
-            pass
-
-        obj = MyClass()
+        obj = logging_class()
         assert isinstance(obj.logger, logging.Logger)
 
-    def test_logger_name_includes_class_name(self):
-        """Test that logger name includes the class name."""
+    def test_logger_name_is_qualified_class_name(self, make_logging_class):
+        """Test that the logger is named after the module and qualified class name."""
+        obj = make_logging_class("MyTestClass")()
+        assert obj.logger.name == f"{__name__}.MyTestClass"
 
-        class MyTestClass(WithLogging):
-            pass
-
-        obj = MyTestClass()
-        assert "MyTestClass" in obj.logger.name
+    def test_base_class_has_logger(self):
+        """Test that WithLogging itself provides a logger."""
+        assert WithLogging().logger.name == "utils.logging.WithLogging"
 
     def test_logger_name_for_nested_class(self):
         """Test logger name for nested class."""
@@ -44,44 +58,32 @@ class TestWithLogging:
                 pass
 
         obj = OuterClass.InnerClass()
-        assert "InnerClass" in obj.logger.name
-
-    def test_logger_is_consistent(self):
-        """Test that multiple calls return consistent logger."""
-
-        class MyClass(WithLogging):
-            pass
+        assert obj.logger.name == f"{__name__}.{OuterClass.InnerClass.__qualname__}"
+        assert obj.logger.name.endswith(".OuterClass.InnerClass")
 
-        obj = MyClass()
+    def test_logger_is_consistent(self, logging_class):
+        """Test that the logger is created once and reused."""
+        obj = logging_class()
         logger1 = obj.logger
         logger2 = obj.logger
 
-        # Should be the same logger (same name)
-        assert logger1.name == logger2.name
-
-    def test_different_classes_get_different_loggers(self):
-        """Test that different classes get different logger names."""
+        assert logger1 is logger2
 
-        class ClassA(WithLogging):
-            pass
+    def test_instances_share_class_logger(self, logging_class):
+        """Test that all instances of a class share the same logger."""
+        assert logging_class().logger is logging_class().logger
 
-        class ClassB(WithLogging):
-            pass
-
-        obj_a = ClassA()
-        obj_b = ClassB()
+    def test_different_classes_get_different_loggers(self, make_logging_class):
+        """Test that different classes get different logger names."""
+        obj_a = make_logging_class("ClassA")()
+        obj_b = make_logging_class("ClassB")()
 
         assert obj_a.logger.name != obj_b.logger.name
-        assert "ClassA" in obj_a.logger.name
-        assert "ClassB" in obj_b.logger.name
+        assert obj_a.logger.name == f"{__name__}.ClassA"
+        assert obj_b.logger.name == f"{__name__}.ClassB"
 
-    def test_logger_can_log_messages(self):
+    def test_logger_can_log_messages(self, logging_class):
         """Test that the logger can actually log messages."""
-
-        class MyClass(WithLogging):
-            def do_something(self):
-                self.logger.info("Test message")
-
-        obj = MyClass()
+        obj = logging_class()
         # Should not raise any exceptions
-        obj.do_something()
+        obj.logger.info("Test message")
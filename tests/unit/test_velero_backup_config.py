@@ -0,0 +1,174 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Unit tests for the velero_backup_config charm library."""
+
+import json
+
+import pytest
+import yaml
+from charms.velero_libs.v0.velero_backup_config import (
+    APP_FIELD,
+    MODEL_FIELD,
+    RELATION_FIELD,
+    SPEC_FIELD,
+    VeleroBackupProvider,
+    VeleroBackupRequier,
+    VeleroBackupSpec,
+)
+from conftest import backup_target_app_data
+from ops import CharmBase
+from ops.testing import Context, Harness, State
+from scenario import Relation
+
+from constants import K8S_BACKUP_TARGET_RELATION, VELERO_BACKUP_RELATION
+
+REQUIRER_META = {
+    "name": "velero-operator",
+    "requires": {VELERO_BACKUP_RELATION: {"interface": "velero_backup_config"}},
+}
+
+
+class RequirerCharm(CharmBase):
+    """Minimal charm consuming velero-backup specs, as velero-operator does."""
+
+    def __init__(self, framework):
+        super().__init__(framework)
+        self.backup = VeleroBackupRequier(self, VELERO_BACKUP_RELATION)
+
+
+PROVIDER_META = {
+    "name": "target-app",
+    "provides": {"backup": {"interface": "velero_backup_config"}},
+}
+
+
+class ProviderCharm(CharmBase):
+    """Minimal charm publishing a velero-backup spec refreshed on config-changed."""
+
+    def __init__(self, framework):
+        super().__init__(framework)
+        self.spec = VeleroBackupSpec(include_namespaces=["ns"], ttl="24h")
+        self.backup = VeleroBackupProvider(
+            self, "backup", spec=self.spec, refresh_event=[self.on.config_changed]
+        )
+
+
+@pytest.fixture
+def requirer_ctx() -> Context:
+    """Create a test context for the requirer charm."""
+    return Context(RequirerCharm, meta=REQUIRER_META)
+
+
+def published_databag(ctx, make_state, velero_relation, spec) -> dict[str, str]:
+    """Run the integrator with one backup target and return what it publishes."""
+    target = Relation(
+        endpoint=K8S_BACKUP_TARGET_RELATION,
+        remote_app_name="target-app",
+        remote_app_data=backup_target_app_data(spec=spec),
+    )
+    state_out = ctx.run(ctx.on.config_changed(), make_state(velero_relation, target))
+    return dict(state_out.get_relation(velero_relation.id).local_app_data)
+
+
+def read_specs(requirer_ctx, databag):
+    """Return the requirer's view of a velero-backup databag."""
+    relation = Relation(
+        endpoint=VELERO_BACKUP_RELATION,
+        remote_app_name="velero-integrator",
+        remote_app_data=databag,
+    )
+    with requirer_ctx(requirer_ctx.on.update_status(), State(relations=[relation])) as mgr:
+        backup = mgr.charm.backup
+        return (
+            backup.get_all_backup_specs(),
+            backup.get_backup_spec("target-app", "backup", "test-model"),
+        )
+
+
+class TestVeleroBackupRequirer:
+    """Tests for VeleroBackupRequier reading specs published by the integrator."""
+
+    def test_reads_published_spec(self, ctx, make_state, velero_relation, requirer_ctx):
+        """Test that a spec published by the integrator is read back."""
+        databag = published_databag(
+            ctx, make_state, velero_relation, {"include_namespaces": ["ns"], "ttl": "24h"}
+        )
+
+        all_specs, spec = read_specs(requirer_ctx, databag)
+
+        assert spec is not None
+        assert spec.include_namespaces == ["ns"]
+        assert spec.ttl == "24h"
+        assert all_specs == [spec]
+
+    def test_returned_specs_are_independent(self, ctx, make_state, velero_relation, requirer_ctx):
+        """Test that callers can modify a spec without affecting later reads."""
+        databag = published_databag(
+            ctx, make_state, velero_relation, {"include_namespaces": ["ns"]}
+        )
+
+        all_specs, spec = read_specs(requirer_ctx, databag)
+        spec.ttl = "1h"
+        spec.include_namespaces.append("other")
+
+        assert all_specs[0].ttl is None
+        assert all_specs[0].include_namespaces == ["ns"]
+
+    def test_invalid_ttl_is_not_published(self, ctx, make_state, velero_relation):
+        """Test that the integrator does not publish a TTL the library rejects."""
+        databag = published_databag(
+            ctx, make_state, velero_relation, {"include_namespaces": ["ns"], "ttl": "30d"}
+        )
+
+        assert SPEC_FIELD not in databag
+
+    def test_skips_spec_with_invalid_ttl(self, requirer_ctx):
+        """Test that an invalid spec, as older integrators published, is skipped."""
+        databag = {
+            APP_FIELD: "target-app",
+            MODEL_FIELD: "test-model",
+            RELATION_FIELD: "backup",
+            SPEC_FIELD: json.dumps({"include_namespaces": ["ns"], "ttl": "30d"}),
+        }
+
+        all_specs, spec = read_specs(requirer_ctx, databag)
+
+        assert all_specs == []
+        assert spec is None
+
+    def test_lookup_sees_updated_relation_data(self):
+        """Test that a requirer kept across events reads the current relation data."""
+        harness = Harness(RequirerCharm, meta=yaml.safe_dump(REQUIRER_META))
+        harness.begin()
+        relation_id = harness.add_relation(VELERO_BACKUP_RELATION, "velero-integrator")
+        databag = {APP_FIELD: "target-app", MODEL_FIELD: "test-model", RELATION_FIELD: "backup"}
+        backup = harness.charm.backup
+
+        for ttl in ("24h", "12h"):
+            harness.update_relation_data(
+                relation_id, "velero-integrator", {**databag, SPEC_FIELD: json.dumps({"ttl": ttl})}
+            )
+            spec = backup.get_backup_spec("target-app", "backup", "test-model")
+            assert spec is not None
+            assert spec.ttl == ttl
+        harness.cleanup()
+
+
+class TestVeleroBackupProvider:
+    """Tests for VeleroBackupProvider publishing specs."""
+
+    def test_refresh_publishes_updated_spec(self):
+        """Test that changes the charm makes to its spec are published on refresh."""
+        harness = Harness(ProviderCharm, meta=yaml.safe_dump(PROVIDER_META))
+        harness.set_leader(True)
+        harness.set_model_name("test-model")
+        harness.begin()
+        relation_id = harness.add_relation("backup", "velero-integrator")
+
+        for ttl in ("24h", "12h"):
+            harness.charm.spec.ttl = ttl
+            harness.charm.on.config_changed.emit()
+            data = harness.get_relation_data(relation_id, "target-app")
+            assert json.loads(data[SPEC_FIELD])["ttl"] == ttl
+        harness.cleanup()